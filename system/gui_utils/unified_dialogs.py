@@ -30,7 +30,11 @@ COLORS = {
 
 
 def _create_dialog_base(parent: tk.Widget | None, title: str) -> tuple[tk.Toplevel, tk.Frame]:
-    """Create a standard dark-themed dialog window with fixed size."""
+    """Create a standard dark-themed dialog window with fixed size.
+
+    The returned content frame is not packed yet so callers can lay out the
+    frame and all of its children in a single pass.
+    """
     dialog = tk.Toplevel()
     dialog.title(title)
     if parent:
@@ -79,13 +83,37 @@ def _create_dialog_base(parent: tk.Widget | None, title: str) -> tuple[tk.Toplev
     except Exception:
         pass
     
-    # Content frame
+    # Content frame (packed by the caller together with its children)
     frame = tk.Frame(dialog, bg=COLORS["panel"])
-    frame.pack(fill=tk.BOTH, expand=True, padx=DIALOG_PADDING, pady=DIALOG_PADDING)
     
     return dialog, frame
 
 
+# Choice values stored in the dialog's IntVar
+_CHOICE_PENDING = -1
+_CHOICE_NO = 0
+_CHOICE_YES = 1
+
+
+def _wait_for_choice(dialog: tk.Toplevel, choice: tk.IntVar) -> int:
+    """Block until a handler sets ``choice``, then close the dialog.
+
+    If the dialog is destroyed from elsewhere the wait ends as a "no".
+    """
+    def on_destroy(event):
+        if event.widget is dialog and choice.get() == _CHOICE_PENDING:
+            choice.set(_CHOICE_NO)
+
+    dialog.bind("<Destroy>", on_destroy, add="+")
+    dialog.wait_variable(choice)
+    value = choice.get()
+    try:
+        dialog.destroy()
+    except Exception:
+        pass
+    return value
+
+
 def show_info(message: str, title: str = "StrategoAI", parent: tk.Widget | None = None) -> None:
     """Show an information dialog with OK button."""
     dialog, frame = _create_dialog_base(parent, title)
@@ -101,14 +129,12 @@ def show_info(message: str, title: str = "StrategoAI", parent: tk.Widget | None
         wraplength=DIALOG_WIDTH - 2 * DIALOG_PADDING - 20,
         anchor="center"
     )
-    lbl.pack(fill=tk.BOTH, expand=True, pady=(0, 12))
     
     # OK button (centered)
-    def on_ok():
+    def on_ok(event=None):
         dialog.destroy()
     
     btn_frame = tk.Frame(frame, bg=COLORS["panel"])
-    btn_frame.pack(anchor="center")
     
     ok_btn = tk.Button(
         btn_frame,
@@ -123,10 +149,15 @@ def show_info(message: str, title: str = "StrategoAI", parent: tk.Widget | None
         width=14,
         font=("Segoe UI", 11, "bold")
     )
+    
+    # Layout: pack everything in one pass once all widgets exist
+    frame.pack(fill=tk.BOTH, expand=True, padx=DIALOG_PADDING, pady=DIALOG_PADDING)
+    lbl.pack(fill=tk.BOTH, expand=True, pady=(0, 12))
+    btn_frame.pack(anchor="center")
     ok_btn.pack()
     
-    dialog.bind("<Return>", lambda e: on_ok())
-    dialog.bind("<Escape>", lambda e: on_ok())
+    dialog.bind("<Return>", on_ok)
+    dialog.bind("<Escape>", on_ok)
     dialog.protocol("WM_DELETE_WINDOW", on_ok)
     
     try:
@@ -152,14 +183,12 @@ def show_error(message: str, title: str = "StrategoAI Error", parent: tk.Widget
         wraplength=DIALOG_WIDTH - 2 * DIALOG_PADDING - 20,
         anchor="center"
     )
-    lbl.pack(fill=tk.BOTH, expand=True, pady=(0, 12))
     
     # OK button (centered)
-    def on_ok():
+    def on_ok(event=None):
         dialog.destroy()
     
     btn_frame = tk.Frame(frame, bg=COLORS["panel"])
-    btn_frame.pack(anchor="center")
     
     ok_btn = tk.Button(
         btn_frame,
@@ -174,10 +203,15 @@ def show_error(message: str, title: str = "StrategoAI Error", parent: tk.Widget
         width=14,
         font=("Segoe UI", 11, "bold")
     )
+    
+    # Layout: pack everything in one pass once all widgets exist
+    frame.pack(fill=tk.BOTH, expand=True, padx=DIALOG_PADDING, pady=DIALOG_PADDING)
+    lbl.pack(fill=tk.BOTH, expand=True, pady=(0, 12))
+    btn_frame.pack(anchor="center")
     ok_btn.pack()
     
-    dialog.bind("<Return>", lambda e: on_ok())
-    dialog.bind("<Escape>", lambda e: on_ok())
+    dialog.bind("<Return>", on_ok)
+    dialog.bind("<Escape>", on_ok)
     dialog.protocol("WM_DELETE_WINDOW", on_ok)
     
     try:
@@ -209,21 +243,17 @@ def ask_yes_no(
         wraplength=DIALOG_WIDTH - 2 * DIALOG_PADDING - 20,
         anchor="center"
     )
-    lbl.pack(fill=tk.BOTH, expand=True, pady=(0, 12))
     
-    result = {"value": False}
+    choice = tk.IntVar(master=dialog, value=_CHOICE_PENDING)
     
-    def on_yes():
-        result["value"] = True
-        dialog.destroy()
+    def on_yes(event=None):
+        choice.set(_CHOICE_YES)
     
-    def on_no():
-        result["value"] = False
-        dialog.destroy()
+    def on_no(event=None):
+        choice.set(_CHOICE_NO)
     
     # Button frame (right-aligned)
     btn_frame = tk.Frame(frame, bg=COLORS["panel"])
-    btn_frame.pack(anchor="e")
     
     no_btn = tk.Button(
         btn_frame,
@@ -238,7 +268,6 @@ def ask_yes_no(
         width=12,
         font=("Segoe UI", 11, "bold")
     )
-    no_btn.pack(side=tk.RIGHT)
     
     yes_btn = tk.Button(
         btn_frame,
@@ -253,10 +282,16 @@ def ask_yes_no(
         width=12,
         font=("Segoe UI", 11, "bold")
     )
+    
+    # Layout: pack everything in one pass once all widgets exist
+    frame.pack(fill=tk.BOTH, expand=True, padx=DIALOG_PADDING, pady=DIALOG_PADDING)
+    lbl.pack(fill=tk.BOTH, expand=True, pady=(0, 12))
+    btn_frame.pack(anchor="e")
+    no_btn.pack(side=tk.RIGHT)
     yes_btn.pack(side=tk.RIGHT, padx=(0, 8))
     
-    dialog.bind("<Return>", lambda e: on_yes())
-    dialog.bind("<Escape>", lambda e: on_no())
+    dialog.bind("<Return>", on_yes)
+    dialog.bind("<Escape>", on_no)
     dialog.protocol("WM_DELETE_WINDOW", on_no)
     
     try:
@@ -264,8 +299,7 @@ def ask_yes_no(
     except Exception:
         pass
     
-    dialog.wait_window()
-    return result["value"]
+    return _wait_for_choice(dialog, choice) == _CHOICE_YES
 
 
 def ask_yes_cancel(
@@ -289,21 +323,17 @@ def ask_yes_cancel(
         wraplength=DIALOG_WIDTH - 2 * DIALOG_PADDING - 20,
         anchor="center"
     )
-    lbl.pack(fill=tk.BOTH, expand=True, pady=(0, 12))
     
-    result: dict[str, bool | None] = {"value": None}
+    choice = tk.IntVar(master=dialog, value=_CHOICE_PENDING)
     
-    def on_yes():
-        result["value"] = True
-        dialog.destroy()
+    def on_yes(event=None):
+        choice.set(_CHOICE_YES)
     
-    def on_cancel():
-        result["value"] = None
-        dialog.destroy()
+    def on_cancel(event=None):
+        choice.set(_CHOICE_NO)
     
     # Button frame (right-aligned)
     btn_frame = tk.Frame(frame, bg=COLORS["panel"])
-    btn_frame.pack(anchor="e")
     
     cancel_btn = tk.Button(
         btn_frame,
@@ -318,7 +348,6 @@ def ask_yes_cancel(
         width=12,
         font=("Segoe UI", 11, "bold")
     )
-    cancel_btn.pack(side=tk.RIGHT)
     
     yes_btn = tk.Button(
         btn_frame,
@@ -333,10 +362,16 @@ def ask_yes_cancel(
         width=12,
         font=("Segoe UI", 11, "bold")
     )
+    
+    # Layout: pack everything in one pass once all widgets exist
+    frame.pack(fill=tk.BOTH, expand=True, padx=DIALOG_PADDING, pady=DIALOG_PADDING)
+    lbl.pack(fill=tk.BOTH, expand=True, pady=(0, 12))
+    btn_frame.pack(anchor="e")
+    cancel_btn.pack(side=tk.RIGHT)
     yes_btn.pack(side=tk.RIGHT, padx=(0, 8))
     
-    dialog.bind("<Return>", lambda e: on_yes())
-    dialog.bind("<Escape>", lambda e: on_cancel())
+    dialog.bind("<Return>", on_yes)
+    dialog.bind("<Escape>", on_cancel)
     dialog.protocol("WM_DELETE_WINDOW", on_cancel)
     
     try:
@@ -344,8 +379,7 @@ def ask_yes_cancel(
     except Exception:
         pass
     
-    dialog.wait_window()
-    return result["value"]
+    return True if _wait_for_choice(dialog, choice) == _CHOICE_YES else None
 
 
 def ask_confirm_destructive(
@@ -369,21 +403,17 @@ def ask_confirm_destructive(
         wraplength=DIALOG_WIDTH - 2 * DIALOG_PADDING - 20,
         anchor="center"
     )
-    lbl.pack(fill=tk.BOTH, expand=True, pady=(0, 12))
     
-    result = {"value": False}
+    choice = tk.IntVar(master=dialog, value=_CHOICE_PENDING)
     
-    def on_confirm():
-        result["value"] = True
-        dialog.destroy()
+    def on_confirm(event=None):
+        choice.set(_CHOICE_YES)
     
-    def on_cancel():
-        result["value"] = False
-        dialog.destroy()
+    def on_cancel(event=None):
+        choice.set(_CHOICE_NO)
     
     # Button frame (right-aligned)
     btn_frame = tk.Frame(frame, bg=COLORS["panel"])
-    btn_frame.pack(anchor="e")
     
     cancel_btn = tk.Button(
         btn_frame,
@@ -398,7 +428,6 @@ def ask_confirm_destructive(
         width=12,
         font=("Segoe UI", 11, "bold")
     )
-    cancel_btn.pack(side=tk.RIGHT)
     
     action_btn = tk.Button(
         btn_frame,
@@ -413,10 +442,16 @@ def ask_confirm_destructive(
         width=12,
         font=("Segoe UI", 11, "bold")
     )
+    
+    # Layout: pack everything in one pass once all widgets exist
+    frame.pack(fill=tk.BOTH, expand=True, padx=DIALOG_PADDING, pady=DIALOG_PADDING)
+    lbl.pack(fill=tk.BOTH, expand=True, pady=(0, 12))
+    btn_frame.pack(anchor="e")
+    cancel_btn.pack(side=tk.RIGHT)
     action_btn.pack(side=tk.RIGHT, padx=(0, 8))
     
-    dialog.bind("<Return>", lambda e: on_confirm())
-    dialog.bind("<Escape>", lambda e: on_cancel())
+    dialog.bind("<Return>", on_confirm)
+    dialog.bind("<Escape>", on_cancel)
     dialog.protocol("WM_DELETE_WINDOW", on_cancel)
     
     try:
@@ -424,8 +459,7 @@ def ask_confirm_destructive(
     except Exception:
         pass
     
-    dialog.wait_window()
-    return result["value"]
+    return _wait_for_choice(dialog, choice) == _CHOICE_YES
 
 
 __all__ = [
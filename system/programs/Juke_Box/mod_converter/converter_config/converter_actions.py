@@ -12,12 +12,20 @@ from pathlib import Path
 from typing import Callable, Optional
 import os
 import shutil
+import subprocess as _subprocess
+import threading
+import time
 
 
 class ActionNotImplementedError(NotImplementedError):
     """Raised when an action has not been implemented yet."""
 
 
+# Serialises PAK jobs: they share the temp extraction directory, which is
+# wiped after each one, and jobs may run on parallel worker threads.
+_TEMP_DIR_LOCK = threading.Lock()
+
+
 def _raise_placeholder(name: str) -> None:
     raise ActionNotImplementedError(
         f"The '{name}' action has not been implemented yet."
@@ -66,11 +74,26 @@ def _read_text(path: Path) -> str:
         return ""
 
 
-def _write_text(path: Path, content: str) -> None:
-    """Write text file atomically."""
+def _write_text(path: Path, content: str, fsync: bool = False) -> None:
+    """Write text file atomically.
+
+    Writes the encoded bytes through a raw file descriptor to skip the
+    TextIOWrapper layer. Pass ``fsync=True`` to flush to disk before the
+    temp file is renamed over the target.
+    """
+    data = content.encode("utf-8")
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(content, encoding="utf-8")
+    tmp = os.fspath(path) + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        if fsync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
     os.replace(tmp, path)
 
 
@@ -91,20 +114,22 @@ def extract_pak_action(pak_path: Path) -> Optional[Path]:
 
 
 def cleanup_temp_files() -> None:
-    """Clean up temporary extraction directory."""
-    try:
-        temp_dir = _temp_extraction_path()
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-            temp_dir.mkdir(parents=True, exist_ok=True)
-    except Exception:
-        pass
+    """Clean up temporary extraction directory.
+
+    The directory is not recreated here; ``_ensure_directories`` does that
+    at the start of the next conversion job.
+    """
+    shutil.rmtree(_temp_extraction_path(), ignore_errors=True)
 
 
 # =============================================================================
 # INI Conversion
 # =============================================================================
 
+# Number of leading bytes inspected when validating a foreign INI
+_VALIDATE_SCAN_BYTES = 65536
+
+
 def detect_mod_name(ini_path: Path) -> str:
     """Detect mod name from INI file.
 
@@ -122,6 +147,9 @@ def detect_mod_name(ini_path: Path) -> str:
 def validate_foreign_ini(ini_path: Path) -> tuple[bool, str]:
     """Validate if an INI file can be converted.
 
+    Only the head of the file is inspected, as raw bytes, so no UTF-8
+    decoding is needed to look for the ASCII section markers.
+
     Args:
         ini_path: Path to the INI file
 
@@ -129,14 +157,18 @@ def validate_foreign_ini(ini_path: Path) -> tuple[bool, str]:
         Tuple of (valid: bool, message: str)
     """
     try:
-        content = _read_text(ini_path)
+        try:
+            with open(ini_path, "rb") as fh:
+                head = fh.read(_VALIDATE_SCAN_BYTES)
+        except FileNotFoundError:
+            head = b""
 
-        if not content:
+        if not head:
             return (False, "File is empty")
 
         # Basic validation - check for some expected sections
         # This is a placeholder - actual validation will depend on foreign mod format
-        if "[Global]" in content or "[/Script/" in content:
+        if b"[Global]" in head or b"[/Script/" in head:
             return (True, "Valid INI format detected")
         else:
             return (False, "Unknown INI format")
@@ -162,6 +194,15 @@ def convert_ini_to_live_mod(source_path: Path, output_name: Optional[str] = None
 # Conversion Workflow
 # =============================================================================
 
+def _validate_and_convert(source: Path) -> tuple[bool, str, Path | str]:
+    """Validate an INI file and convert it to Live Mod format."""
+    valid, msg = validate_foreign_ini(source)
+    if not valid:
+        return (False, f"Validation failed: {msg}", "")
+
+    return convert_ini_to_live_mod(source)
+
+
 def process_conversion_job(source_path: str, source_type: str) -> tuple[bool, str, str]:
     """Process a conversion job from start to finish.
 
@@ -181,22 +222,16 @@ def process_conversion_job(source_path: str, source_type: str) -> tuple[bool, st
 
         # Handle PAK files
         if source_type == "pak":
-            extracted_ini = extract_pak_action(source)
-            if not extracted_ini:
-                return (False, "Failed to extract INI from PAK", "")
-            source = extracted_ini
-
-        # Validate INI
-        valid, msg = validate_foreign_ini(source)
-        if not valid:
-            return (False, f"Validation failed: {msg}", "")
-
-        # Convert to Live Mod format
-        success, msg, output_path = convert_ini_to_live_mod(source)
-
-        # Cleanup temp files if this was a PAK extraction
-        if source_type == "pak":
-            cleanup_temp_files()
+            with _TEMP_DIR_LOCK:
+                extracted_ini = extract_pak_action(source)
+                if not extracted_ini:
+                    return (False, "Failed to extract INI from PAK", "")
+                success, msg, output_path = _validate_and_convert(extracted_ini)
+
+                # Cleanup temp files from the PAK extraction
+                cleanup_temp_files()
+        else:
+            success, msg, output_path = _validate_and_convert(source)
 
         return (success, msg, str(output_path))
 
@@ -217,8 +252,7 @@ def open_output_folder() -> None:
         if os.name == 'nt':  # Windows
             os.startfile(str(output_path))  # type: ignore
         elif os.name == 'posix':  # macOS/Linux
-            import subprocess
-            subprocess.run(['xdg-open', str(output_path)])
+            _subprocess.run(['xdg-open', str(output_path)])
     except Exception:
         pass
 
@@ -241,8 +275,7 @@ def get_output_path_for_mod(mod_name: str) -> Path:
         safe_name = "Converted_Mod"
 
     # Add timestamp to avoid conflicts
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
     filename = f"{safe_name}_{timestamp}.ini"
 
     return output_dir / filename
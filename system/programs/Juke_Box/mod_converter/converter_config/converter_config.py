@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
-from typing import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Sequence
+import time
 
 
 WINDOW_TITLE = "StrategoAI - Mod Converter"
@@ -15,27 +16,51 @@ WINDOW_MAX_SIZE = (WINDOW_WIDTH, WINDOW_HEIGHT)
 
 LEFT_PANEL_RATIO = 0.40
 
+# Conversion log: buffered messages are written to the widget at most
+# once per this many milliseconds
+LOG_FLUSH_INTERVAL_MS = 50
+# Oldest log lines are trimmed once the log grows past this many lines
+MAX_LOG_LINES = 2000
 
-@dataclass
+# Upper bound on conversion jobs processed concurrently off the UI thread
+CONVERSION_MAX_WORKERS = 4
+
+
+@dataclass(slots=True, eq=False)
 class ConversionJob:
     """Represents a mod conversion job.
 
+    Uses ``__slots__`` to keep per-instance memory small for large batches.
+    Not frozen: ``status`` and ``output_path`` are updated during conversion.
+
     Attributes:
         source_path: Path to the source file (.ini or .pak)
         source_type: Type of source ("ini" or "pak")
         mod_name: Detected or user-provided mod name
         status: Current status of conversion
         output_path: Path where converted mod will be saved
+        display_name: File name of the source, derived from source_path
     """
     source_path: str
     source_type: str
     mod_name: str
     status: str
     output_path: str = ""
+    display_name: str = field(init=False, repr=False, default="")
+    _cached_hash: Optional[int] = field(default=None, init=False, repr=False)
+    # Row of this job in the converter's jobs listbox (-1 if not listed)
+    _list_index: int = field(default=-1, init=False, repr=False)
+
+    def __post_init__(self):
+        """Cache the file name shown in the queue and log."""
+        self.display_name = Path(self.source_path).name
 
     def __hash__(self):
-        """Hash based on source path."""
-        return hash(self.source_path)
+        """Hash based on source path (computed once)."""
+        h = self._cached_hash
+        if h is None:
+            h = self._cached_hash = hash(self.source_path)
+        return h
 
     def __eq__(self, other):
         """Equality based on source path."""
@@ -84,7 +109,7 @@ Steps:
 
 def current_date_string() -> str:
     """Return the current system date in the expected format (DD.MM.YYYY)."""
-    return datetime.now().strftime("%d.%m.%Y")
+    return time.strftime("%d.%m.%Y")
 
 
 __all__ = [
@@ -94,6 +119,9 @@ __all__ = [
     "WINDOW_MIN_SIZE",
     "WINDOW_MAX_SIZE",
     "LEFT_PANEL_RATIO",
+    "LOG_FLUSH_INTERVAL_MS",
+    "MAX_LOG_LINES",
+    "CONVERSION_MAX_WORKERS",
     "ConversionJob",
     "SOURCE_TYPES",
     "STATUS_PENDING",
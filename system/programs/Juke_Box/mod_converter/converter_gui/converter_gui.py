@@ -4,16 +4,12 @@ from __future__ import annotations
 
 import sys
 import tkinter as tk
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk, filedialog
 from pathlib import Path
 from typing import Optional
 
-try:
-    from PIL import Image, ImageTk  # type: ignore
-except Exception:
-    Image = None  # type: ignore
-    ImageTk = None  # type: ignore
-
 from ..converter_config.converter_config import (
     ACTION_BUTTONS,
     DEFAULT_HELP_TEXT,
@@ -23,13 +19,15 @@ from ..converter_config.converter_config import (
     WINDOW_TITLE,
     WINDOW_WIDTH,
     LEFT_PANEL_RATIO,
+    LOG_FLUSH_INTERVAL_MS,
+    MAX_LOG_LINES,
+    CONVERSION_MAX_WORKERS,
     ConversionJob,
     STATUS_PENDING,
     STATUS_EXTRACTING,
     STATUS_CONVERTING,
     STATUS_COMPLETED,
     STATUS_FAILED,
-    current_date_string,
 )
 
 from system.gui_utils.unified_dialogs import show_info, show_error, ask_yes_cancel
@@ -104,6 +102,11 @@ class ModConverterApp:
         # State
         self.conversion_jobs: list[ConversionJob] = []
         self.selected_job: Optional[ConversionJob] = None
+        self._jobs_in_flight = 0
+        # Status buckets keyed by id(job), in queue order; kept in sync with
+        # job.status so actions don't have to scan conversion_jobs
+        self._pending_jobs: dict[int, ConversionJob] = {}
+        self._completed_jobs: dict[int, ConversionJob] = {}
 
         # UI Components
         self.main_frame: Optional[tk.Frame] = None
@@ -111,6 +114,12 @@ class ModConverterApp:
         self.right_panel: Optional[tk.Frame] = None
         self.jobs_listbox: Optional[tk.Listbox] = None
         self.log_text: Optional[tk.Text] = None
+        self._map_binding: Optional[str] = None
+
+        # Pending log lines, written to log_text by _flush_log
+        self._log_buffer: deque[tuple[str, str]] = deque()
+        self._log_flush_scheduled = False
+        self._log_line_count = 0
 
         # Initialize UI
         self._setup_window()
@@ -145,8 +154,25 @@ class ModConverterApp:
         # Left panel (conversion queue + actions)
         self._build_left_panel()
 
-        # Right panel (conversion log)
+        # Right panel (conversion log) is built the first time the frame
+        # is mapped, i.e. when the converter tab is actually shown
+        self._map_binding = self.main_frame.bind("<Map>", self._on_first_map)
+
+    def _on_first_map(self, event=None) -> None:
+        """Build the deferred right panel once the UI becomes visible."""
+        if self._map_binding and self.main_frame:
+            self.main_frame.unbind("<Map>", self._map_binding)
+            self._map_binding = None
+        self._ensure_right_panel()
+
+    def _ensure_right_panel(self) -> None:
+        """Build the right panel on first use and flush any buffered log."""
+        if self.right_panel is not None:
+            return
         self._build_right_panel()
+        if self._log_buffer and not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
 
     def _build_left_panel(self) -> None:
         """Build the left panel with conversion queue and action buttons."""
@@ -196,24 +222,31 @@ class ModConverterApp:
         button_frame = tk.Frame(self.left_panel, bg=self.palette["content_bg"])
         button_frame.pack(fill="x", padx=10, pady=10)
 
+        # Resolve palette colours once for all buttons and hover handlers
+        normal_bg = self.palette["button_bg"]
+        hover_bg = self.palette["button_hover"]
+        btn_kwargs = dict(
+            bg=normal_bg,
+            fg=self.palette["text_primary"],
+            font=("Segoe UI", 9),
+            borderwidth=0,
+            padx=10,
+            pady=5,
+            cursor="hand2",
+        )
+
         for btn_text, action_id in ACTION_BUTTONS:
             btn = tk.Button(
                 button_frame,
                 text=btn_text,
-                bg=self.palette["button_bg"],
-                fg=self.palette["text_primary"],
-                font=("Segoe UI", 9),
-                borderwidth=0,
-                padx=10,
-                pady=5,
-                cursor="hand2",
                 command=lambda aid=action_id: self._execute_action(aid),
+                **btn_kwargs,
             )
             btn.pack(fill="x", pady=2)
 
             # Hover effects
-            btn.bind("<Enter>", lambda e, b=btn: b.config(bg=self.palette["button_hover"]))
-            btn.bind("<Leave>", lambda e, b=btn: b.config(bg=self.palette["button_bg"]))
+            btn.bind("<Enter>", lambda e, b=btn: b.config(bg=hover_bg))
+            btn.bind("<Leave>", lambda e, b=btn: b.config(bg=normal_bg))
 
     def _build_right_panel(self) -> None:
         """Build the right panel with conversion log."""
@@ -274,24 +307,93 @@ class ModConverterApp:
             message: Message text
             tag: Text tag for coloring (info, success, warning, error)
         """
-        if not self.log_text:
+        # Buffer the message; the widget is updated once per flush tick.
+        # Until the right panel exists, messages just wait in the buffer.
+        self._log_buffer.append((message, tag))
+        if self.log_text and not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
+
+    def _flush_log(self) -> None:
+        """Write all buffered log messages to the log widget in one pass."""
+        self._log_flush_scheduled = False
+        if not self.log_text or not self._log_buffer:
             return
 
+        # Build one interleaved (text, tag, text, tag, ...) argument list,
+        # merging consecutive messages that share a tag into one span
+        chunks: list[str] = []
+        lines: list[str] = []
+        current_tag = self._log_buffer[0][1]
+        for message, tag in self._log_buffer:
+            if tag != current_tag:
+                chunks.extend(("".join(lines), current_tag))
+                lines = []
+                current_tag = tag
+            lines.append(f"{message}\n")
+        chunks.extend(("".join(lines), current_tag))
+        self._log_buffer.clear()
+
+        # Single normal/disabled pair around the insert and the trim
         self.log_text.config(state="normal")
-        self.log_text.insert(tk.END, f"{message}\n", tag)
+        self.log_text.insert(tk.END, *chunks)
+        self._log_line_count += sum(text.count("\n") for text in chunks[::2])
+        self._trim_log()
         self.log_text.see(tk.END)
         self.log_text.config(state="disabled")
 
+    def _trim_log(self) -> None:
+        """Drop the oldest lines so the log holds at most MAX_LOG_LINES.
+
+        The caller must have put log_text into the "normal" state.
+        """
+        overflow = self._log_line_count - MAX_LOG_LINES
+        if overflow <= 0:
+            return
+
+        self.log_text.delete("1.0", f"{overflow + 1}.0")
+        self._log_line_count -= overflow
+
     def _update_jobs_list(self) -> None:
-        """Update the jobs listbox with current conversion jobs."""
+        """Rebuild the jobs listbox from scratch and re-index every job.
+
+        Status changes go through ``_refresh_job_row``, new jobs through
+        ``_append_job`` and removals through ``_handle_clear_completed``.
+        """
         if not self.jobs_listbox:
             return
 
         self.jobs_listbox.delete(0, tk.END)
-        for job in self.conversion_jobs:
-            source_name = Path(job.source_path).name
-            display = f"[{job.status}] {source_name}"
-            self.jobs_listbox.insert(tk.END, display)
+        for idx, job in enumerate(self.conversion_jobs):
+            job._list_index = idx
+            self.jobs_listbox.insert(tk.END, self._job_row_text(job))
+
+    @staticmethod
+    def _job_row_text(job: ConversionJob) -> str:
+        """Return the listbox display text for a job."""
+        return f"[{job.status}] {job.display_name}"
+
+    def _append_job(self, job: ConversionJob) -> None:
+        """Add a job to the queue and append its listbox row."""
+        job._list_index = len(self.conversion_jobs)
+        self.conversion_jobs.append(job)
+        self._pending_jobs[id(job)] = job
+        if self.jobs_listbox:
+            self.jobs_listbox.insert(tk.END, self._job_row_text(job))
+
+    def _refresh_job_row(self, job: ConversionJob) -> None:
+        """Redraw the single listbox row belonging to a job."""
+        if not self.jobs_listbox:
+            return
+
+        idx = job._list_index
+        if idx < 0:
+            return
+        was_selected = self.jobs_listbox.selection_includes(idx)
+        self.jobs_listbox.delete(idx)
+        self.jobs_listbox.insert(idx, self._job_row_text(job))
+        if was_selected:
+            self.jobs_listbox.selection_set(idx)
 
     def _on_job_selected(self, event) -> None:
         """Handle job selection."""
@@ -306,7 +408,7 @@ class ModConverterApp:
         idx = selection[0]
         if 0 <= idx < len(self.conversion_jobs):
             self.selected_job = self.conversion_jobs[idx]
-            self._log_message(f"\nSelected: {Path(self.selected_job.source_path).name}", "info")
+            self._log_message(f"\nSelected: {self.selected_job.display_name}", "info")
 
     def _execute_action(self, action_id: str) -> None:
         """Execute an action by its ID."""
@@ -353,9 +455,8 @@ class ModConverterApp:
             status=STATUS_PENDING,
         )
 
-        self.conversion_jobs.append(job)
-        self._update_jobs_list()
-        self._log_message(f"Added INI file: {Path(file_path).name}", "success")
+        self._append_job(job)
+        self._log_message(f"Added INI file: {job.display_name}", "success")
 
     def _handle_add_pak(self) -> None:
         """Handle add PAK file action."""
@@ -379,68 +480,106 @@ class ModConverterApp:
             status=STATUS_PENDING,
         )
 
-        self.conversion_jobs.append(job)
-        self._update_jobs_list()
-        self._log_message(f"Added PAK file: {Path(file_path).name}", "success")
+        self._append_job(job)
+        self._log_message(f"Added PAK file: {job.display_name}", "success")
 
     def _handle_start_conversion(self) -> None:
-        """Handle start conversion action."""
-        pending_jobs = [j for j in self.conversion_jobs if j.status == STATUS_PENDING]
+        """Handle start conversion action.
+
+        Jobs run on a small worker pool so the Tk main loop keeps pumping;
+        results are marshalled back to the UI thread via ``after``.
+        """
+        pending_jobs = list(self._pending_jobs.values())
 
         if not pending_jobs:
             show_info(self.root, "No Jobs", "No pending conversion jobs in queue.")
             return
+        self._pending_jobs.clear()
 
         self._log_message(f"\n=== Starting conversion of {len(pending_jobs)} job(s) ===", "info")
 
-        for job in pending_jobs:
-            self._convert_job(job)
-
-        self._log_message("\n=== Conversion batch completed ===", "success")
+        self._jobs_in_flight += len(pending_jobs)
+        executor = ThreadPoolExecutor(
+            max_workers=min(CONVERSION_MAX_WORKERS, len(pending_jobs)),
+            thread_name_prefix="ModConverter",
+        )
+        try:
+            for job in pending_jobs:
+                self._convert_job(job, executor)
+        finally:
+            # Worker threads finish the queued jobs, then exit
+            executor.shutdown(wait=False)
 
-    def _convert_job(self, job: ConversionJob) -> None:
-        """Convert a single job.
+    def _convert_job(self, job: ConversionJob, executor: ThreadPoolExecutor) -> None:
+        """Submit a single job to the worker pool.
 
         Args:
             job: ConversionJob to process
+            executor: Pool that runs the conversion off the UI thread
         """
-        try:
-            self._log_message(f"\nProcessing: {Path(job.source_path).name}", "info")
+        self._log_message(f"\nProcessing: {job.display_name}", "info")
 
-            # Update status
-            job.status = STATUS_EXTRACTING if job.source_type == "pak" else STATUS_CONVERTING
-            self._update_jobs_list()
+        # Update status (on the UI thread, so a second click cannot resubmit)
+        job.status = STATUS_EXTRACTING if job.source_type == "pak" else STATUS_CONVERTING
+        self._refresh_job_row(job)
 
-            # Process the conversion
-            success, message, output_path = process_conversion_job(job.source_path, job.source_type)
+        future = executor.submit(process_conversion_job, job.source_path, job.source_type)
+        future.add_done_callback(
+            lambda f, j=job: self.root.after(0, self._apply_job_result, j, f)
+        )
+
+    def _apply_job_result(self, job: ConversionJob, future: Future) -> None:
+        """Apply a finished conversion to the job (runs on the UI thread).
+
+        Args:
+            job: ConversionJob that was processed
+            future: Completed future returned by the worker pool
+        """
+        try:
+            success, message, output_path = future.result()
 
             if success:
                 job.status = STATUS_COMPLETED
                 job.output_path = output_path
-                self._log_message(f" {message}", "success")
+                self._completed_jobs[id(job)] = job
+                self._log_message(f"✓ {message}", "success")
                 self._log_message(f"  Output: {output_path}", "info")
             else:
                 job.status = STATUS_FAILED
-                self._log_message(f" {message}", "error")
+                self._log_message(f"✗ {message}", "error")
 
         except Exception as e:
             job.status = STATUS_FAILED
-            self._log_message(f" Error: {e}", "error")
+            self._log_message(f"✗ Error: {e}", "error")
 
         finally:
-            self._update_jobs_list()
+            self._refresh_job_row(job)
+            self._jobs_in_flight -= 1
+            if self._jobs_in_flight == 0:
+                self._log_message("\n=== Conversion batch completed ===", "success")
 
     def _handle_clear_completed(self) -> None:
         """Handle clear completed jobs action."""
-        initial_count = len(self.conversion_jobs)
-        self.conversion_jobs = [j for j in self.conversion_jobs if j.status != STATUS_COMPLETED]
-        removed_count = initial_count - len(self.conversion_jobs)
-
-        if removed_count > 0:
-            self._update_jobs_list()
-            self._log_message(f"\nCleared {removed_count} completed job(s)", "info")
-        else:
+        if not self._completed_jobs:
             show_info(self.root, "Nothing to Clear", "No completed jobs in queue.")
+            return
+
+        # Splice rows out from the bottom up so earlier indices stay valid
+        completed = sorted(self._completed_jobs.values(), key=lambda j: j._list_index, reverse=True)
+        self._completed_jobs.clear()
+        first_removed = completed[-1]._list_index
+        for job in completed:
+            idx = job._list_index
+            del self.conversion_jobs[idx]
+            if self.jobs_listbox:
+                self.jobs_listbox.delete(idx)
+            job._list_index = -1
+
+        # Only rows below the first removed one changed position
+        for idx in range(first_removed, len(self.conversion_jobs)):
+            self.conversion_jobs[idx]._list_index = idx
+
+        self._log_message(f"\nCleared {len(completed)} completed job(s)", "info")
 
     def _handle_open_output(self) -> None:
         """Handle open output folder action."""
@@ -8,8 +8,11 @@ This module provides the business logic for managing mod sets:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 import os
 import json
 
@@ -24,8 +27,9 @@ def _raise_placeholder(name: str) -> None:
     )
 
 
+@lru_cache(maxsize=1)
 def _local_appdata() -> Path:
-    """Return the local AppData directory."""
+    """Return the local AppData directory (resolved once per process)."""
     base = os.environ.get("LOCALAPPDATA")
     if base:
         return Path(base)
@@ -33,8 +37,9 @@ def _local_appdata() -> Path:
     return Path.home() / "AppData" / "Local"
 
 
+@lru_cache(maxsize=1)
 def _mod_sets_path() -> Path:
-    """Return path to the mod sets storage directory."""
+    """Return path to the mod sets storage directory (resolved once per process)."""
     try:
         from system.config_main.main_actions import get_user_mod_files_path
         return get_user_mod_files_path() / "ModSets"
@@ -43,6 +48,12 @@ def _mod_sets_path() -> Path:
         return _local_appdata() / "StrategoAI_Live_Mod" / "ModSets"
 
 
+def _clear_path_caches() -> None:
+    """Forget memoized paths, e.g. after LOCALAPPDATA changed."""
+    _local_appdata.cache_clear()
+    _mod_sets_path.cache_clear()
+
+
 def _ensure_mod_sets_directory() -> None:
     """Create the mod sets directory if it doesn't exist."""
     path = _mod_sets_path()
@@ -59,9 +70,14 @@ def _read_text(path: Path) -> str:
 
 def _write_text(path: Path, content: str) -> None:
     """Write text file atomically."""
+    _write_bytes(path, content.encode("utf-8"))
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write binary file atomically."""
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(content, encoding="utf-8")
+    tmp.write_bytes(data)
     os.replace(tmp, path)
 
 
@@ -149,35 +165,99 @@ def import_set_action(import_path: Path) -> None:
 # Mod Set Data Access
 # =============================================================================
 
-def get_mod_sets() -> list[dict[str, any]]:
-    """Return list of all mod sets.
+# Below this many changed files get_mod_sets parses serially
+_PARALLEL_READ_MIN_FILES = 4
+_PARALLEL_READ_MAX_WORKERS = 8
 
-    Returns:
-        List of dictionaries with keys: name, templates, active, created
+# Parsed mod-set files keyed by path: (st_mtime_ns, entry or None if malformed)
+_MOD_SETS_CACHE: dict[str, tuple[int, dict[str, Any] | None]] = {}
+
+
+def _parse_mod_set_file(path: str) -> dict[str, Any] | None:
+    """Parse one mod-set JSON file, returning None if it is malformed."""
+    try:
+        with open(path, "rb") as fh:
+            data = json.loads(fh.read())
+        return {
+            "name": data.get("name", os.path.splitext(os.path.basename(path))[0]),
+            "templates": data.get("templates", []),
+            "active": data.get("active", False),
+            "created": data.get("created", ""),
+        }
+    except Exception:
+        return None
+
+
+def _scan_mod_sets() -> list[dict[str, Any]]:
+    """Scan the ModSets directory and return all parseable mod sets.
+
+    Files are only re-parsed when their modification time changed since
+    the previous scan; unchanged files are served from a cache. When
+    several files need parsing they are read on a small thread pool.
     """
     _ensure_mod_sets_directory()
     sets_dir = _mod_sets_path()
     mod_sets = []
+    seen: dict[str, tuple[int, dict[str, Any] | None]] = {}
 
     try:
-        for file in sets_dir.glob("*.json"):
-            try:
-                data = json.loads(_read_text(file))
-                mod_sets.append({
-                    "name": data.get("name", file.stem),
-                    "templates": data.get("templates", []),
-                    "active": data.get("active", False),
-                    "created": data.get("created", ""),
-                })
-            except Exception:
+        stale: list[tuple[str, int]] = []
+        with os.scandir(sets_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    mtime = entry.stat().st_mtime_ns
+                except OSError:
+                    continue
+                file = entry.path
+                cached = _MOD_SETS_CACHE.get(file)
+                if cached is None or cached[0] != mtime:
+                    stale.append((file, mtime))
+                    cached = (mtime, None)
+                seen[file] = cached
+
+        if stale:
+            stale_files = [file for file, _ in stale]
+            if len(stale) < _PARALLEL_READ_MIN_FILES:
+                parsed = map(_parse_mod_set_file, stale_files)
+            else:
+                workers = min(_PARALLEL_READ_MAX_WORKERS, len(stale))
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    parsed = list(pool.map(_parse_mod_set_file, stale_files))
+            for (file, mtime), entry in zip(stale, parsed):
+                seen[file] = (mtime, entry)
+
+        for _mtime, entry in seen.values():
+            if entry is None:
                 # Skip malformed files
                 continue
+            mod_sets.append(dict(entry))
     except Exception:
         pass
 
+    # Replace the cache so deleted files are dropped
+    _MOD_SETS_CACHE.clear()
+    _MOD_SETS_CACHE.update(seen)
+
     return mod_sets
 
 
+def get_mod_sets() -> list[dict[str, Any]]:
+    """Return list of all mod sets.
+
+    The directory is listed on every call so added, removed or externally
+    edited files are picked up; only files whose modification time changed
+    are parsed again.
+
+    Returns:
+        List of dictionaries with keys: name, templates, active, created
+    """
+    return _scan_mod_sets()
+
+
 def get_available_templates() -> list[str]:
     """Return list of available mod templates.
 
@@ -189,18 +269,22 @@ def get_available_templates() -> list[str]:
     return []
 
 
-def register_actions() -> dict[str, Callable[[], None]]:
-    """Return a mapping of action names for potential future integration."""
-    return {
-        "create_set": lambda: create_set_action("", []),
-        "edit_set": lambda: edit_set_action("", []),
-        "delete_set": lambda: delete_set_action(""),
-        "activate_set": lambda: activate_set_action(""),
-        "deactivate_set": lambda: deactivate_set_action(""),
-        "duplicate_set": lambda: duplicate_set_action("", ""),
-        "export_set": lambda: export_set_action("", Path()),
-        "import_set": lambda: import_set_action(Path()),
-    }
+# Action name -> handler. Callers dispatch by name and pass real arguments.
+_ACTIONS: Mapping[str, Callable[..., None]] = MappingProxyType({
+    "create_set": create_set_action,
+    "edit_set": edit_set_action,
+    "delete_set": delete_set_action,
+    "activate_set": activate_set_action,
+    "deactivate_set": deactivate_set_action,
+    "duplicate_set": duplicate_set_action,
+    "export_set": export_set_action,
+    "import_set": import_set_action,
+})
+
+
+def register_actions() -> Mapping[str, Callable[..., None]]:
+    """Return the read-only mapping of action names to their handlers."""
+    return _ACTIONS
 
 
 __all__ = [
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
 from typing import Sequence
 
 
@@ -16,32 +17,30 @@ WINDOW_MAX_SIZE = (WINDOW_WIDTH, WINDOW_HEIGHT)
 LEFT_PANEL_RATIO = 0.33
 ROWS_PER_PAGE = 19
 
+# Maximum number of rendered mod-set detail texts kept in memory
+DETAILS_CACHE_SIZE = 128
 
-@dataclass
+# Delay used to coalesce rapid set list selection events
+SELECT_DEBOUNCE_MS = 50
+
+
+@dataclass(slots=True, frozen=True)
 class ModSetEntry:
-    """Represents a mod set configuration.
+    """Represents a mod set configuration (immutable, slotted record).
+
+    Equality and hashing compare all fields.
 
     Attributes:
         name: Display name of the mod set
-        templates: List of template filenames included in this set
+        templates: Tuple of template filenames included in this set
         active: Whether this mod set is currently active
         created: Creation date string
     """
     name: str
-    templates: list[str]
+    templates: tuple[str, ...]
     active: bool
     created: str
 
-    def __hash__(self):
-        """Hash based only on name."""
-        return hash(self.name)
-
-    def __eq__(self, other):
-        """Equality based only on name."""
-        if not isinstance(other, ModSetEntry):
-            return False
-        return self.name == other.name
-
 
 # Action buttons for the left panel
 ACTION_BUTTONS: Sequence[tuple[str, str]] = (
@@ -58,9 +57,18 @@ ACTION_BUTTONS: Sequence[tuple[str, str]] = (
 DEFAULT_HELP_TEXT = "Select a mod set to see details."
 
 
+@lru_cache(maxsize=1)
+def _format_day(ordinal: int) -> str:
+    """Format a proleptic Gregorian ordinal as DD.MM.YYYY."""
+    return date.fromordinal(ordinal).strftime("%d.%m.%Y")
+
+
 def current_date_string() -> str:
-    """Return the current system date in the expected format (DD.MM.YYYY)."""
-    return datetime.now().strftime("%d.%m.%Y")
+    """Return the current system date in the expected format (DD.MM.YYYY).
+
+    The formatted string is cached and only rebuilt when the day changes.
+    """
+    return _format_day(date.today().toordinal())
 
 
 __all__ = [
@@ -71,6 +79,8 @@ __all__ = [
     "WINDOW_MAX_SIZE",
     "LEFT_PANEL_RATIO",
     "ROWS_PER_PAGE",
+    "DETAILS_CACHE_SIZE",
+    "SELECT_DEBOUNCE_MS",
     "ModSetEntry",
     "ACTION_BUTTONS",
     "DEFAULT_HELP_TEXT",
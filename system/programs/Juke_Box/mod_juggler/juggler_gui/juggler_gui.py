@@ -3,18 +3,15 @@
 from __future__ import annotations
 
 import sys
+import threading
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
+from collections import OrderedDict
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
-try:
-    from PIL import Image, ImageTk  # type: ignore
-except Exception:
-    Image = None  # type: ignore
-    ImageTk = None  # type: ignore
-
 from ..juggler_config.juggler_config import (
     ACTION_BUTTONS,
     DEFAULT_HELP_TEXT,
@@ -25,8 +22,9 @@ from ..juggler_config.juggler_config import (
     WINDOW_WIDTH,
     LEFT_PANEL_RATIO,
     ROWS_PER_PAGE,
+    DETAILS_CACHE_SIZE,
+    SELECT_DEBOUNCE_MS,
     ModSetEntry,
-    current_date_string,
 )
 
 from system.gui_utils.unified_dialogs import show_info, show_error, ask_yes_cancel
@@ -46,6 +44,10 @@ from ..juggler_config.juggler_actions import (
 )
 
 
+# Active-column marker indexed by the set's active flag
+_TAG = ("[ ]", "[✓]")
+
+
 class ModJugglerApp:
     """Mod Juggler application for managing mod sets.
 
@@ -95,21 +97,55 @@ class ModJugglerApp:
                 "border": "#1f2937",
             }
 
+        # Palette colours bound to attributes once, so build code and hover
+        # handlers skip the dict lookups
+        self._c_background = self.palette["background"]
+        self._c_content_bg = self.palette["content_bg"]
+        self._c_button_bg = self.palette["button_bg"]
+        self._c_button_hover = self.palette["button_hover"]
+        self._c_text_primary = self.palette["text_primary"]
+        self._c_text_secondary = self.palette["text_secondary"]
+        self._c_accent = self.palette["accent"]
+        self._c_border = self.palette["border"]
+
         # State
-        self.mod_sets: list[ModSetEntry] = []
+        # Mod sets stored column-wise (index i across all lists is one set);
+        # tree refreshes only touch names/active. ModSetEntry objects are
+        # built on demand by _mod_set_at.
+        self._names: list[str] = []
+        self._active: list[bool] = []
+        self._templates: list[tuple[str, ...]] = []
+        self._created: list[str] = []
         self.selected_set: Optional[ModSetEntry] = None
+        self._page_index = 0
+        self._select_after_id: Optional[str] = None
+        # Tree row values (marker, name), parallel to the mod set columns
+        self._display_rows: tuple[tuple[str, str], ...] = ()
+        # Rendered details text per (name, templates, active, created) of a
+        # mod set (LRU, cleared on reload)
+        self._details_cache: OrderedDict[tuple[str, tuple[str, ...], bool, str], str] = OrderedDict()
+        # Text currently in the details widget (None until first render)
+        self._details_shown: Optional[str] = None
 
         # UI Components
         self.main_frame: Optional[tk.Frame] = None
         self.left_panel: Optional[tk.Frame] = None
         self.right_panel: Optional[tk.Frame] = None
-        self.mod_set_listbox: Optional[tk.Listbox] = None
+        self.mod_set_tree: Optional[ttk.Treeview] = None
         self.details_text: Optional[tk.Text] = None
+        self.page_label: Optional[tk.Label] = None
+
+        # Action id -> bound handler, e.g. "create_set" -> _handle_create_set
+        self._action_dispatch = {
+            action_id: getattr(self, f"_handle_{action_id}")
+            for _, action_id in ACTION_BUTTONS
+        }
 
         # Initialize UI
         self._setup_window()
         self._build_layout()
-        self._load_mod_sets()
+        # Disk I/O runs after first paint; the set list fills in when it lands
+        self.root.after(0, self._load_mod_sets_async)
 
     def _setup_window(self) -> None:
         """Configure the window properties."""
@@ -118,14 +154,14 @@ class ModJugglerApp:
             self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
             self.root.minsize(*WINDOW_MIN_SIZE)
             self.root.maxsize(*WINDOW_MAX_SIZE)
-            self.root.configure(bg=self.palette["background"])
+            self.root.configure(bg=self._c_background)
 
     def _build_layout(self) -> None:
         """Build the main UI layout."""
         # Main container
         self.main_frame = tk.Frame(
             self.root,
-            bg=self.palette["background"],
+            bg=self._c_background,
             borderwidth=0,
             highlightthickness=0,
         )
@@ -146,7 +182,7 @@ class ModJugglerApp:
         """Build the left panel with mod set list and action buttons."""
         self.left_panel = tk.Frame(
             self.main_frame,
-            bg=self.palette["content_bg"],
+            bg=self._c_content_bg,
             borderwidth=1,
             relief="solid",
         )
@@ -157,63 +193,122 @@ class ModJugglerApp:
             self.left_panel,
             text="Mod Sets",
             font=("Segoe UI", 12, "bold"),
-            bg=self.palette["content_bg"],
-            fg=self.palette["text_primary"],
+            bg=self._c_content_bg,
+            fg=self._c_text_primary,
         )
         title_label.pack(pady=(10, 5))
 
-        # Mod set listbox
-        listbox_frame = tk.Frame(self.left_panel, bg=self.palette["content_bg"])
-        listbox_frame.pack(fill="both", expand=True, padx=10, pady=5)
+        # Mod set list (Treeview: rows keyed by absolute set index, selection yields iids)
+        tree_frame = tk.Frame(self.left_panel, bg=self._c_content_bg)
+        tree_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
-        scrollbar = tk.Scrollbar(listbox_frame)
+        scrollbar = tk.Scrollbar(tree_frame)
         scrollbar.pack(side="right", fill="y")
 
-        self.mod_set_listbox = tk.Listbox(
-            listbox_frame,
-            bg=self.palette["background"],
-            fg=self.palette["text_primary"],
-            selectbackground=self.palette["accent"],
-            selectforeground=self.palette["text_primary"],
+        style = ttk.Style(self.root)
+        style.configure(
+            "Juggler.Treeview",
+            background=self._c_background,
+            fieldbackground=self._c_background,
+            foreground=self._c_text_primary,
+            bordercolor=self._c_border,
             font=("Segoe UI", 10),
+        )
+        style.configure(
+            "Juggler.Treeview.Heading",
+            background=self._c_button_bg,
+            foreground=self._c_text_primary,
+            font=("Segoe UI", 9, "bold"),
+        )
+        style.map(
+            "Juggler.Treeview",
+            background=[("selected", self._c_accent)],
+            foreground=[("selected", self._c_text_primary)],
+        )
+
+        self.mod_set_tree = ttk.Treeview(
+            tree_frame,
+            columns=("active", "name"),
+            show="headings",
+            style="Juggler.Treeview",
+            height=ROWS_PER_PAGE,
+            selectmode="browse",
             yscrollcommand=scrollbar.set,
+        )
+        self.mod_set_tree.heading("active", text="Active")
+        self.mod_set_tree.heading("name", text="Name", anchor="w")
+        self.mod_set_tree.column("active", width=50, anchor="center", stretch=False)
+        self.mod_set_tree.column("name", anchor="w", stretch=True)
+        self.mod_set_tree.pack(side="left", fill="both", expand=True)
+        scrollbar.config(command=self.mod_set_tree.yview)
+
+        self.mod_set_tree.bind("<<TreeviewSelect>>", self._on_set_selected)
+
+        # Page navigation (only ROWS_PER_PAGE sets are in the tree at once)
+        nav_frame = tk.Frame(self.left_panel, bg=self._c_content_bg)
+        nav_frame.pack(fill="x", padx=10)
+
+        nav_kwargs = dict(
+            bg=self._c_button_bg,
+            fg=self._c_text_primary,
+            activebackground=self._c_button_hover,
+            font=("Segoe UI", 9),
             borderwidth=0,
-            highlightthickness=1,
-            highlightbackground=self.palette["border"],
+            width=3,
+            cursor="hand2",
         )
-        self.mod_set_listbox.pack(side="left", fill="both", expand=True)
-        scrollbar.config(command=self.mod_set_listbox.yview)
-
-        self.mod_set_listbox.bind("<<ListboxSelect>>", self._on_set_selected)
+        tk.Button(
+            nav_frame, text="\u25c0", command=lambda: self._render_page(self._page_index - 1), **nav_kwargs
+        ).pack(side="left")
+        tk.Button(
+            nav_frame, text="\u25b6", command=lambda: self._render_page(self._page_index + 1), **nav_kwargs
+        ).pack(side="right")
+        self.page_label = tk.Label(
+            nav_frame,
+            text="",
+            font=("Segoe UI", 9),
+            bg=self._c_content_bg,
+            fg=self._c_text_secondary,
+        )
+        self.page_label.pack(side="left", expand=True)
 
         # Action buttons
-        button_frame = tk.Frame(self.left_panel, bg=self.palette["content_bg"])
+        button_frame = tk.Frame(self.left_panel, bg=self._c_content_bg)
         button_frame.pack(fill="x", padx=10, pady=10)
 
+        normal_bg = self._c_button_bg
+        hover_bg = self._c_button_hover
+        btn_kwargs = dict(
+            bg=normal_bg,
+            fg=self._c_text_primary,
+            font=("Segoe UI", 9),
+            borderwidth=0,
+            padx=10,
+            pady=5,
+            cursor="hand2",
+        )
+
+        # Hover effects: one class binding shared by all action buttons
+        # instead of two closures per button
+        hover_tag = f"JugglerActionButton{id(self)}"
+        self.root.bind_class(hover_tag, "<Enter>", lambda e: e.widget.config(bg=hover_bg))
+        self.root.bind_class(hover_tag, "<Leave>", lambda e: e.widget.config(bg=normal_bg))
+
         for btn_text, action_id in ACTION_BUTTONS:
             btn = tk.Button(
                 button_frame,
                 text=btn_text,
-                bg=self.palette["button_bg"],
-                fg=self.palette["text_primary"],
-                font=("Segoe UI", 9),
-                borderwidth=0,
-                padx=10,
-                pady=5,
-                cursor="hand2",
-                command=lambda aid=action_id: self._execute_action(aid),
+                command=partial(self._execute_action, action_id),
+                **btn_kwargs,
             )
+            btn.bindtags((hover_tag,) + btn.bindtags())
             btn.pack(fill="x", pady=2)
 
-            # Hover effects
-            btn.bind("<Enter>", lambda e, b=btn: b.config(bg=self.palette["button_hover"]))
-            btn.bind("<Leave>", lambda e, b=btn: b.config(bg=self.palette["button_bg"]))
-
     def _build_right_panel(self) -> None:
         """Build the right panel with mod set details."""
         self.right_panel = tk.Frame(
             self.main_frame,
-            bg=self.palette["content_bg"],
+            bg=self._c_content_bg,
             borderwidth=1,
             relief="solid",
         )
@@ -224,13 +319,13 @@ class ModJugglerApp:
             self.right_panel,
             text="Mod Set Details",
             font=("Segoe UI", 12, "bold"),
-            bg=self.palette["content_bg"],
-            fg=self.palette["text_primary"],
+            bg=self._c_content_bg,
+            fg=self._c_text_primary,
         )
         title_label.pack(pady=(10, 5))
 
         # Details text widget
-        text_frame = tk.Frame(self.right_panel, bg=self.palette["content_bg"])
+        text_frame = tk.Frame(self.right_panel, bg=self._c_content_bg)
         text_frame.pack(fill="both", expand=True, padx=10, pady=5)
 
         scrollbar = tk.Scrollbar(text_frame)
@@ -238,57 +333,114 @@ class ModJugglerApp:
 
         self.details_text = tk.Text(
             text_frame,
-            bg=self.palette["background"],
-            fg=self.palette["text_primary"],
+            bg=self._c_background,
+            fg=self._c_text_primary,
             font=("Consolas", 10),
             wrap="word",
             yscrollcommand=scrollbar.set,
             borderwidth=0,
             highlightthickness=1,
-            highlightbackground=self.palette["border"],
+            highlightbackground=self._c_border,
             state="disabled",
         )
         self.details_text.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=self.details_text.yview)
 
-    def _load_mod_sets(self) -> None:
-        """Load mod sets from storage and populate the listbox."""
+    def _load_mod_sets_async(self) -> None:
+        """Load mod sets on a worker thread and populate the set list on the UI thread."""
+        def worker() -> None:
+            try:
+                sets_data = get_mod_sets()
+            except Exception as e:
+                self.root.after(0, show_error, self.root, "Load Error", f"Failed to load mod sets: {e}")
+                return
+            self.root.after(0, self._populate_set_list, sets_data)
+
+        threading.Thread(target=worker, name="JugglerLoadModSets", daemon=True).start()
+
+    def _populate_set_list(self, sets_data: list[dict]) -> None:
+        """Store loaded mod sets and render the current page.
+
+        Args:
+            sets_data: Mod set dicts as returned by ``get_mod_sets``
+        """
         try:
-            sets_data = get_mod_sets()
-            self.mod_sets = [
-                ModSetEntry(
-                    name=s["name"],
-                    templates=s["templates"],
-                    active=s["active"],
-                    created=s["created"],
-                )
-                for s in sets_data
-            ]
-
-            # Update listbox
-            if self.mod_set_listbox:
-                self.mod_set_listbox.delete(0, tk.END)
-                for mod_set in self.mod_sets:
-                    display = f"{'[] ' if mod_set.active else '[ ] '}{mod_set.name}"
-                    self.mod_set_listbox.insert(tk.END, display)
+            self._details_cache.clear()
+            self._names = [s["name"] for s in sets_data]
+            self._active = [s["active"] for s in sets_data]
+            self._templates = [tuple(s["templates"]) for s in sets_data]
+            self._created = [s["created"] for s in sets_data]
+
+            # Build every display string once; pages are slices of this
+            self._display_rows = tuple(
+                (_TAG[active], name)
+                for name, active in zip(self._names, self._active)
+            )
+
+            # Update set list
+            self._render_page(self._page_index)
 
         except Exception as e:
             show_error(self.root, "Load Error", f"Failed to load mod sets: {e}")
 
+    def _page_count(self) -> int:
+        """Return the number of set list pages (at least one)."""
+        return max(1, -(-len(self._names) // ROWS_PER_PAGE))
+
+    def _mod_set_at(self, idx: int) -> ModSetEntry:
+        """Build a ModSetEntry view for the mod set at absolute index ``idx``."""
+        return ModSetEntry(
+            name=self._names[idx],
+            templates=self._templates[idx],
+            active=self._active[idx],
+            created=self._created[idx],
+        )
+
+    def _render_page(self, page: int) -> None:
+        """Show one page of mod sets in the tree.
+
+        Args:
+            page: Zero-based page index; clamped to the valid range
+        """
+        self._page_index = min(max(page, 0), self._page_count() - 1)
+        if self.page_label:
+            self.page_label.config(text=f"Page {self._page_index + 1} / {self._page_count()}")
+        tree = self.mod_set_tree
+        if not tree:
+            return
+
+        start = self._page_index * ROWS_PER_PAGE
+        rows = self._display_rows[start:start + ROWS_PER_PAGE]
+        tree.delete(*tree.get_children())
+        # iids are absolute indices: set names need not be unique
+        for i, values in enumerate(rows, start):
+            tree.insert("", "end", iid=str(i), values=values)
+
     def _on_set_selected(self, event) -> None:
-        """Handle mod set selection."""
-        if not self.mod_set_listbox:
+        """Handle mod set selection.
+
+        Bursts of selection events (keyboard navigation, drag-select) are
+        coalesced into a single ``_apply_selection`` call.
+        """
+        if self._select_after_id is not None:
+            self.root.after_cancel(self._select_after_id)
+        self._select_after_id = self.root.after(SELECT_DEBOUNCE_MS, self._apply_selection)
+
+    def _apply_selection(self) -> None:
+        """Apply the current tree selection to the details panel."""
+        self._select_after_id = None
+        if not self.mod_set_tree:
             return
 
-        selection = self.mod_set_listbox.curselection()
+        selection = self.mod_set_tree.selection()
         if not selection:
             self.selected_set = None
             self._update_details(None)
             return
 
-        idx = selection[0]
-        if 0 <= idx < len(self.mod_sets):
-            self.selected_set = self.mod_sets[idx]
+        idx = int(selection[0])
+        if idx < len(self._names):
+            self.selected_set = self._mod_set_at(idx)
             self._update_details(self.selected_set)
 
     def _update_details(self, mod_set: Optional[ModSetEntry]) -> None:
@@ -296,44 +448,51 @@ class ModJugglerApp:
         if not self.details_text:
             return
 
+        text = DEFAULT_HELP_TEXT if mod_set is None else self._details_for(mod_set)
+        # Re-selecting the same set (or a refresh) leaves the widget untouched
+        if text == self._details_shown:
+            return
+
         self.details_text.config(state="normal")
         self.details_text.delete("1.0", tk.END)
-
-        if mod_set is None:
-            self.details_text.insert("1.0", DEFAULT_HELP_TEXT)
-        else:
-            details = f"""Mod Set: {mod_set.name}
+        self.details_text.insert("1.0", text)
+        self.details_text.config(state="disabled")
+        self._details_shown = text
+
+    def _details_for(self, mod_set: ModSetEntry) -> str:
+        """Return the details text for a mod set, rendering it on a cache miss."""
+        # Keyed by value: equal sets share a rendering, and the key does not
+        # depend on how ModSetEntry defines equality or hashing
+        key = (mod_set.name, tuple(mod_set.templates), mod_set.active, mod_set.created)
+        details = self._details_cache.get(key)
+        if details is not None:
+            self._details_cache.move_to_end(key)
+            return details
+
+        details = self._format_details(mod_set)
+        self._details_cache[key] = details
+        if len(self._details_cache) > DETAILS_CACHE_SIZE:
+            self._details_cache.popitem(last=False)
+        return details
+
+    @staticmethod
+    def _format_details(mod_set: ModSetEntry) -> str:
+        """Render the details panel text for a mod set."""
+        header = f"""Mod Set: {mod_set.name}
 Status: {'Active' if mod_set.active else 'Inactive'}
 Created: {mod_set.created}
 
 Templates ({len(mod_set.templates)}):
 """
-            for i, template in enumerate(mod_set.templates, 1):
-                details += f"  {i}. {template}\n"
-
-            self.details_text.insert("1.0", details)
-
-        self.details_text.config(state="disabled")
+        lines = [f"  {i}. {template}\n" for i, template in enumerate(mod_set.templates, 1)]
+        return header + "".join(lines)
 
     def _execute_action(self, action_id: str) -> None:
         """Execute an action by its ID."""
         try:
-            if action_id == "create_set":
-                self._handle_create_set()
-            elif action_id == "edit_set":
-                self._handle_edit_set()
-            elif action_id == "delete_set":
-                self._handle_delete_set()
-            elif action_id == "activate_set":
-                self._handle_activate_set()
-            elif action_id == "deactivate_set":
-                self._handle_deactivate_set()
-            elif action_id == "duplicate_set":
-                self._handle_duplicate_set()
-            elif action_id == "export_set":
-                self._handle_export_set()
-            elif action_id == "import_set":
-                self._handle_import_set()
+            handler = self._action_dispatch.get(action_id)
+            if handler is not None:
+                handler()
             else:
                 show_info(self.root, "Info", f"Action '{action_id}' not implemented yet.")
 
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
+import sys
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
 from typing import Sequence
 
 
@@ -17,27 +19,19 @@ LEFT_PANEL_RATIO = 0.33
 ROWS_PER_PAGE = 19
 
 
-@dataclass
+@dataclass(slots=True, unsafe_hash=True)
 class ParameterEntry:
     """Represents an individual editable mission parameter.
 
-    The value field is mutable while label and category are used for hashing.
-    This allows the entry to be used as a dictionary key while its value can change.
+    Identity (equality and hashing) is based on label and category only, so
+    an entry stays usable as a dictionary key while the editor updates its
+    value in place.
     """
 
     label: str
-    value: str
+    value: str = field(compare=False)
     category: str
-
-    def __hash__(self):
-        """Hash based only on label and category, not value."""
-        return hash((self.label, self.category))
-
-    def __eq__(self, other):
-        """Equality based only on label and category, not value."""
-        if not isinstance(other, ParameterEntry):
-            return False
-        return self.label == other.label and self.category == other.category
+    ini_key: str | None = field(default=None, compare=False)
 
 
 @dataclass(frozen=True)
@@ -48,7 +42,17 @@ class ParameterPage:
     entries: Sequence[ParameterEntry]
 
 
-CATEGORY_BUTTONS: Sequence[str] = (
+def _interned(*values: str) -> tuple[str, ...]:
+    """Return values as a tuple of interned strings.
+
+    Option labels are compared against and used as dict keys throughout the
+    UI; interned copies let identical labels short-circuit on identity.
+    """
+
+    return tuple(sys.intern(v) for v in values)
+
+
+CATEGORY_BUTTONS: Sequence[str] = _interned(
     "Spawning & KI-Count",
     "Health & Stun Damage",
     "Accuracy & Shooting Behavior",
@@ -58,14 +62,14 @@ CATEGORY_BUTTONS: Sequence[str] = (
     "Weapon Firerates",
 )
 
-TEMPLATE_OPTIONS: Sequence[str] = (
+TEMPLATE_OPTIONS: Sequence[str] = _interned(
     "Select a template...",
     "Live Mod Defaults",
     "Hardcore Suppression",
     "Community Favorites",
 )
 
-DIFFICULTY_OPTIONS: Sequence[str] = (
+DIFFICULTY_OPTIONS: Sequence[str] = _interned(
     "Standard",
     "Hard",
     "Elite",
@@ -74,10 +78,20 @@ DIFFICULTY_OPTIONS: Sequence[str] = (
 DEFAULT_HELP_TEXT = "Select a parameter to see its help."
 
 
+@lru_cache(maxsize=1)
+def _format_day(ordinal: int) -> str:
+    """Format a proleptic Gregorian ordinal as DD.MM.YYYY."""
+
+    return date.fromordinal(ordinal).strftime("%d.%m.%Y")
+
+
 def current_date_string() -> str:
-    """Return the current system date in the expected format (DD.MM.YYYY)."""
+    """Return the current system date in the expected format (DD.MM.YYYY).
+
+    The formatted string is cached and only rebuilt when the day changes.
+    """
 
-    return datetime.now().strftime("%d.%m.%Y")
+    return _format_day(date.today().toordinal())
 
 
 __all__ = [
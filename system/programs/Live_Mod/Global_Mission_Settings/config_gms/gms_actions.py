@@ -11,17 +11,20 @@ Other actions remain placeholders until specified.
 
 from __future__ import annotations
 
-from typing import Callable, Iterable
+from typing import Any, Callable, Iterable
 from pathlib import Path
+import atexit
+import hashlib
 import os
 import re
 import threading
 from collections import deque
+from functools import lru_cache
 from time import monotonic
 import sys
 import subprocess
 import shutil
-from typing import Sequence
+from typing import AnyStr, Sequence
 from typing import Tuple
 
 # Lightweight in-process event bus for notifying other UIs
@@ -30,10 +33,25 @@ try:
 except Exception:  # pragma: no cover
     _event_bus = None  # type: ignore
 
+# Bound once so publishing is a single local call
+_event_publish = _event_bus.publish if _event_bus is not None else None
+
+
 def _publish_work_ini_changed() -> None:
+    if _event_publish is None:
+        return
+    try:
+        _event_publish("work_ini_changed")
+    except Exception:
+        pass
+
+
+def _publish_work_ini_reset() -> None:
+    """Notify listeners that work.ini was replaced and needs a full UI rebuild."""
+    if _event_publish is None:
+        return
     try:
-        if _event_bus is not None:
-            _event_bus.publish("work_ini_changed")
+        _event_publish("work_ini_reset")
     except Exception:
         pass
 
@@ -48,7 +66,9 @@ def _raise_placeholder(name: str) -> None:
     )
 
 
+@lru_cache(maxsize=1)
 def _local_appdata() -> Path:
+    """Return the local AppData directory (resolved once per process)."""
     base = os.environ.get("LOCALAPPDATA")
     if base:
         return Path(base)
@@ -56,29 +76,52 @@ def _local_appdata() -> Path:
     return Path.home() / "AppData" / "Local"
 
 
+@lru_cache(maxsize=1)
 def _work_ini_path() -> Path:
     return _local_appdata() / "ReadyOrNot" / "Saved" / "Config" / "StrategoAI_Live_Mod" / "Work" / "work.ini"
 
 
+@lru_cache(maxsize=1)
 def _user_info_path() -> Path:
     """Return path to the persistent mirror file (user_mission_info.json)."""
     # Verwendet den zentralen, benutzerspezifischen Pfad in AppData.
-    from system.config_main.main_actions import get_user_mod_files_path
-    path = get_user_mod_files_path() / "user_mission_info.json"
-    return path
+    if get_user_mod_files_path is None:
+        return _user_mod_files_fallback() / "user_mission_info.json"
+    return get_user_mod_files_path() / "user_mission_info.json"
+
+
+def _user_mod_files_fallback() -> Path:
+    """Same location as main_actions.get_user_mod_files_path, for when it is unavailable."""
+    return _local_appdata() / "ReadyOrNot" / "Saved" / "Config" / "my_AImod_files"
 
 
 def mirror_exists() -> bool:
     try:
-        return _user_info_path().exists()
+        path = _user_info_path()
+        return _FILE_WRITER.pending(path) is not None or path.exists()
     except Exception:
         return False
 
 
+@lru_cache(maxsize=1)
 def _active_difficulties_path() -> Path:
     return _local_appdata() / "ReadyOrNot" / "Saved" / "Config" / "Difficulties"
 
 
+def _clear_path_caches() -> None:
+    """Forget memoized paths, e.g. after LOCALAPPDATA changed."""
+    global _work_ini_seeded
+    _local_appdata.cache_clear()
+    _work_ini_path.cache_clear()
+    _user_info_path.cache_clear()
+    _active_difficulties_path.cache_clear()
+    _app_base_path.cache_clear()
+    _template_path.cache_clear()
+    _application_root.cache_clear()
+    _template_directories.cache_clear()
+    _work_ini_seeded = False
+
+
 # Legacy user keys that are NO LONGER USED
 # These keys have been replaced by the new mapping system:
 # - DifficultyNameKey (replaces Modname)
@@ -97,7 +140,70 @@ def _read_text(path: Path) -> str:
         return ""
 
 
+def _read_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return b""
+
+
+@lru_cache(maxsize=8)
+def _cached_template_bytes(path: Path) -> bytes:
+    """Return the bytes of a bundled, read-only template (read once per process)."""
+    return path.read_bytes()
+
+
+def _read_template_text(path: Path) -> str:
+    """``_read_text`` for bundled templates, served from ``_cached_template_bytes``."""
+    try:
+        data = _cached_template_bytes(path)
+    except FileNotFoundError:
+        return ""
+    # Same newline translation as read_text()
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+# (stamp, text) of the last work.ini content read through _read_work_text
+_work_text_cache: tuple[tuple[str, int, int], str] | None = None
+
+
+def _read_work_text(path: Path) -> str:
+    """``_read_text`` for work.ini, reusing the last content while mtime/size are unchanged."""
+    global _work_text_cache
+    stamp = _mirror_stamp(path)
+    if stamp is None:
+        return ""
+    cached = _work_text_cache
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    text = _read_text(path)
+    _work_text_cache = (stamp, text)
+    return text
+
+
+def _forget_work_text(path: Path) -> None:
+    """Drop the cached work.ini text when ``path`` is about to be rewritten."""
+    global _work_text_cache, _ini_values_cache
+    cached = _work_text_cache
+    if cached is not None and cached[0][0] == str(path):
+        _work_text_cache = None
+    parsed = _ini_values_cache
+    if parsed is not None and parsed[0][0] == str(path):
+        _ini_values_cache = None
+
+
+def _global_block_bytes(data: bytes) -> bytes | None:
+    """Return the raw [Global] section body (header excluded), or None if absent."""
+    start_idx = data.find(b"[Global]")
+    if start_idx < 0:
+        return None
+    rest_start = start_idx + len(b"[Global]")
+    end_idx = data.find(b"\n[", rest_start)
+    return data[rest_start:end_idx] if end_idx >= 0 else data[rest_start:]
+
+
 def _write_text(path: Path, content: str) -> None:
+    _forget_work_text(path)
     path.parent.mkdir(parents=True, exist_ok=True)
     # Write atomically when possible
     tmp = path.with_suffix(path.suffix + ".tmp")
@@ -115,6 +221,42 @@ def _write_text(path: Path, content: str) -> None:
 # - UI_Modname, UI_Version, UI_Date, UI_Notes (in mirror file only)
 
 
+@lru_cache(maxsize=128)
+def _kv_block_rx(keys: frozenset[str]) -> re.Pattern[str]:
+    """Return a cached (prefix)(key)(sep)(value)(eol) pattern matching any of ``keys``.
+
+    Matches whole lines anywhere in a multi-line buffer (a line starts after
+    any of CR/LF), so a block can be rewritten with one ``sub`` call.
+    """
+    alternation = "|".join(re.escape(k) for k in sorted(keys))
+    return re.compile(
+        rf"(?:\A|(?<=[\r\n]))(?P<prefix>[^\S\r\n]*)(?P<key>{alternation})"
+        rf"(?P<sep>[^\S\r\n]*=[^\S\r\n]*)(?P<val>[^\r\n]*?)(?P<eol>\r\n|\n|\r)",
+        re.IGNORECASE,
+    )
+
+
+@lru_cache(maxsize=512)
+def _header_kv_line_rx(key: str) -> re.Pattern[str]:
+    """Return the cached global-header line pattern for ``key`` (EOL optional)."""
+    return re.compile(
+        rf"^(?P<prefix>\s*)(?P<key>(?i:{re.escape(key)}))(?P<sep>\s*=\s*)(?P<val>.*?)(?P<eol>(\r\n|\n|\r)?)$"
+    )
+
+
+@lru_cache(maxsize=128)
+def _values_rx(keys: frozenset[bytes]) -> re.Pattern[bytes]:
+    """Return the cached uncommented ``key = value`` line pattern for read_ini_values.
+
+    Works on the raw file bytes; keys match case-insensitively.
+    """
+    alternation = b"|".join(re.escape(k) for k in sorted(keys))
+    return re.compile(
+        rb"^[^\S\n]*(?![;#])(?P<key>" + alternation + rb")[^\S\n]*=[^\S\n]*(?P<val>[^\n]*)",
+        re.IGNORECASE | re.MULTILINE,
+    )
+
+
 def _set_or_append_kv_block(existing: str, *, keys: Iterable[str], values: dict[str, str]) -> str:
     """Replace existing key lines preserving exact formatting; never alter layout.
 
@@ -125,42 +267,31 @@ def _set_or_append_kv_block(existing: str, *, keys: Iterable[str], values: dict[
     - Parameter keys (not user info) preserve their original formatting including whitespace.
     """
     # Detect existing newline style
-    newline = "\r\n" if "\r\n" in existing else "\n"
-    # Keepends so we preserve per-line line endings
-    lines = existing.splitlines(keepends=True)
+    newline = _detect_eol(existing)
     seen: set[str] = set()
-    key_res: dict[str, re.Pattern[str]] = {}
+    # Matched key text (any case) -> requested key; first spelling wins
+    canonical: dict[str, str] = {}
     for k in keys:
-        # Capture: (prefix)(key)(sep)(value)(eol)
-        key_res[k] = re.compile(
-            rf"^(?P<prefix>\s*)(?P<key>{re.escape(k)})"
-            rf"(?P<sep>\s*=\s*)(?P<val>.*?)(?P<eol>(\r\n|\n|\r))$",
-            re.IGNORECASE,
-        )
+        canonical.setdefault(k.lower(), k)
 
-    for i, line in enumerate(lines):
-        for k, rx in key_res.items():
-            m = rx.match(line)
-            if m:
-                new_val = values.get(k, "")
-                # Preserve existing formatting (prefix, separator, EOL)
-                prefix = m.group('prefix')
-                separator = m.group('sep')
-                lines[i] = f"{prefix}{m.group('key')}{separator}{new_val}{m.group('eol')}"
-                seen.add(k)
-                break
+    def _replace(m: re.Match[str]) -> str:
+        key = m.group('key')
+        k = canonical[key.lower()]
+        seen.add(k)
+        # Preserve existing formatting (prefix, separator, EOL)
+        return f"{m.group('prefix')}{key}{m.group('sep')}{values.get(k, '')}{m.group('eol')}"
+
+    # Capture: (prefix)(key)(sep)(value)(eol), one pass over the whole block
+    updated = _kv_block_rx(frozenset(canonical.values())).sub(_replace, existing) if canonical else existing
 
     # Append missing keys at the end to ensure new parameters persist
     missing = [k for k in values.keys() if k not in seen]
     if missing:
         # Ensure file ends with a newline
-        if lines and not lines[-1].endswith(("\r\n", "\n", "\r")):
-            lines[-1] = lines[-1] + ("\r\n" if "\r\n" in existing else "\n")
-        nl = "\r\n" if "\r\n" in existing else "\n"
-        for k in missing:
-            v = values.get(k, "")
-            lines.append(f"{k}={v}{nl}")
-    return "".join(lines)
+        if updated and not updated.endswith(("\r\n", "\n", "\r")):
+            updated += newline
+        updated += "".join(f"{k}={values.get(k, '')}{newline}" for k in missing)
+    return updated
 
 
 def _set_or_append_kv_in_global_header(existing: str, *, values: dict[str, str]) -> str:
@@ -175,7 +306,7 @@ def _set_or_append_kv_in_global_header(existing: str, *, values: dict[str, str])
         return existing
 
     # Detect newline style from existing text
-    newline = "\r\n" if "\r\n" in existing else "\n"
+    newline = _detect_eol(existing)
     lines = existing.splitlines(keepends=True)
 
     # Find the boundary of the global header (first section header '[' at column 0, ignoring leading spaces)
@@ -185,10 +316,7 @@ def _set_or_append_kv_in_global_header(existing: str, *, values: dict[str, str])
             header_end_idx = i
             break
 
-    key_res: dict[str, re.Pattern[str]] = {
-        k: re.compile(rf"^(?P<prefix>\s*)(?P<key>(?i:{re.escape(k)}))(?P<sep>\s*=\s*)(?P<val>.*?)(?P<eol>(\r\n|\n|\r)?)$")
-        for k in values.keys()
-    }
+    key_res: dict[str, re.Pattern[str]] = {k: _header_kv_line_rx(k) for k in values.keys()}
 
     seen: set[str] = set()
     for i in range(header_end_idx):
@@ -219,39 +347,77 @@ def _write_user_info_to_files(values: dict[str, str]) -> None:
     return
 
 
-def _template_path() -> Path:
-    """Return path to the base template for seeding work.ini."""
-    # Uses the application base path to be portable in frozen builds.
+@lru_cache(maxsize=1)
+def _app_base_path() -> Path:
+    """Return main_actions' application base path, resolved once.
+
+    get_application_base_path walks up the tree probing the filesystem, so
+    template lookups share this memoized result instead.
+    """
     try:
-        from system.config_main.main_actions import get_application_base_path
-        base = get_application_base_path()
+        return get_application_base_path()
     except Exception:
         # Fallback for development environments where the import might fail
         # or when get_application_base_path is not available.
-        base = Path(__file__).resolve().parents[5] # Assumes a fixed structure
-    return base / "system" / "templates" / "build" / "Mod_Base.ini"
+        return Path(__file__).resolve().parents[5] # Assumes a fixed structure
+
+
+@lru_cache(maxsize=1)
+def _template_path() -> Path:
+    """Return path to the base template for seeding work.ini."""
+    # Uses the application base path to be portable in frozen builds.
+    return _app_base_path() / "system" / "templates" / "build" / "Mod_Base.ini"
+
+
+# Mod_Base.ini programming markers: the global part ends at '#;Global /end',
+# '#;empty_line' becomes a blank line and any other '#;' line is dropped
+_TPL_GLOBAL_END_RX = re.compile(r"^[^\S\n]*#;Global /end", re.MULTILINE)
+_TPL_EMPTY_LINE_RX = re.compile(r"^[^\S\n]*#;empty_line[^\S\n]*$", re.MULTILINE)
+_TPL_MARKER_LINE_RX = re.compile(r"^[^\S\n]*#;.*(?:\n|\Z)", re.MULTILINE)
 
 
 def _seed_work_ini_from_template_if_missing() -> None:
     work_path = _work_ini_path()
     if work_path.exists():
         return
-    tpl = _read_text(_template_path())
-    lines: list[str] = []
-    for raw in tpl.splitlines():
-        if raw.strip().startswith("#;Global /end"):
-            break
-        if raw.strip() == "#;empty_line":
-            lines.append("")
-            continue
-        if raw.strip().startswith("#;"):
-            # programming markers are not emitted into work.ini
-            continue
-        lines.append(raw)
-    content = "\n".join(lines) + "\n"
+    tpl = _read_template_text(_template_path())
+    end = _TPL_GLOBAL_END_RX.search(tpl)
+    if end is not None:
+        tpl = tpl[:end.start()]
+    if tpl and not tpl.endswith("\n"):
+        tpl += "\n"
+    content = _TPL_EMPTY_LINE_RX.sub("", tpl)
+    # programming markers are not emitted into work.ini
+    content = _TPL_MARKER_LINE_RX.sub("", content) or "\n"
     _write_text(work_path, content)
 
 
+# Set once work.ini is known to exist, so the hot writers skip the exists() check
+_work_ini_seeded = False
+
+
+def _ensure_work_ini() -> None:
+    """Seed work.ini from the template once per process (until reset)."""
+    global _work_ini_seeded
+    if _work_ini_seeded:
+        return
+    _seed_work_ini_from_template_if_missing()
+    _work_ini_seeded = True
+
+
+def _read_work_ini_for_update() -> str:
+    """Return work.ini text for a rewrite, seeding the file first if needed."""
+    global _work_ini_seeded
+    _ensure_work_ini()
+    text = _read_work_text(_work_ini_path())
+    if not text:
+        # Removed behind our back (e.g. uninstall): check and seed again
+        _work_ini_seeded = False
+        _ensure_work_ini()
+        text = _read_work_text(_work_ini_path())
+    return text
+
+
 def _write_user_info_to_work(values: dict[str, str]) -> None:
     """Deprecated: legacy [Global] user keys are no longer written."""
     return
@@ -262,63 +428,149 @@ def _write_user_info_to_work(values: dict[str, str]) -> None:
 # Use get_user_ui_info_from_mirror() instead to read UI_* keys from mirror
 
 
+# (stamp, requested keys, result) of the last read_ini_values call
+_ini_values_cache: tuple[tuple[str, int, int], tuple[str, ...], dict[str, str]] | None = None
+
+
 def read_ini_values(keys: Sequence[str]) -> dict[str, str]:
     """Read arbitrary key=value pairs from [Global] section only.
 
     Returns a dict for the requested keys. Missing keys map to "".
     Only reads from [Global] section to avoid conflicts with mission-specific parameters.
+    Repeated reads of the same keys are answered from a cache while work.ini's
+    mtime/size are unchanged (the GUI watcher polls this every second).
     """
-    text = _read_text(_work_ini_path())
-    result: dict[str, str] = {k: "" for k in keys}
-    if not text:
-        return result
+    global _ini_values_cache
+    flush_pending_writes()
+    path = _work_ini_path()
+    stamp = _mirror_stamp(path)
+    wanted_keys = tuple(keys)
+    cached = _ini_values_cache
+    if stamp is not None and cached is not None and cached[0] == stamp and cached[1] == wanted_keys:
+        return dict(cached[2])
+    result = _parse_ini_values(_read_bytes(path), wanted_keys)
+    if stamp is not None:
+        _ini_values_cache = (stamp, wanted_keys, dict(result))
+    return result
 
-    # Extract [Global] section only
-    start_idx = text.find("[Global]")
-    if start_idx < 0:
+
+def _parse_ini_values(data: bytes, keys: Sequence[str]) -> dict[str, str]:
+    """Return the requested [Global] values of work.ini content ``data``."""
+    result: dict[str, str] = {k: "" for k in keys}
+    # Extract [Global] section only (bytes; only matched values are decoded)
+    block = _global_block_bytes(data)
+    if not block or not result:
         return result
 
-    # Find end of [Global] section (next section starting with '[')
-    rest = text[start_idx + len("[Global]"):]
-    end_idx = rest.find("\n[")
-    if end_idx >= 0:
-        block = rest[:end_idx]
-    else:
-        block = rest
+    # Lower-cased key -> requested spellings sharing it
+    wanted: dict[bytes, list[str]] = {}
+    for k in result:
+        wanted.setdefault(k.lower().encode("utf-8"), []).append(k)
 
-    lines = block.splitlines()
     # Allow leading whitespace, and ignore commented lines starting with ';' or '#'
-    # Use inline (?i:...) for case-insensitive key match only
-    patterns: dict[str, re.Pattern[str]] = {
-        k: re.compile(rf"^\s*(?![;#])(?i:{re.escape(k)})\s*=\s*(.*)$") for k in keys
-    }
-    for line in lines:
-        for k, pat in patterns.items():
-            m = pat.match(line)
-            if m:
-                # Strip inline comments
-                val = m.group(1).split(";", 1)[0].split("#", 1)[0].strip()
-                result[k] = val
+    for m in _values_rx(frozenset(wanted)).finditer(block):
+        # Strip inline comments
+        val = m.group("val").split(b";", 1)[0].split(b"#", 1)[0].strip().decode("utf-8")
+        for k in wanted[m.group("key").lower()]:
+            result[k] = val
     return result
 
 
-def write_ini_values(values: dict[str, str]) -> None:
+# Coalescing of rapid write_ini_values calls (one disk write + one publish per burst)
+_WRITE_DEBOUNCE_MS = 50
+_pending_ini_values: dict[str, str] = {}
+_pending_ini_lock = threading.Lock()
+# (Tk widget, after id) of the scheduled flush, if any
+_flush_job: tuple[Any, str] | None = None
+# Serializes flushes so an older batch can never land after a newer one
+_flush_lock = threading.Lock()
+
+
+def write_ini_values(values: dict[str, str], root: Any = None) -> None:
     """Write arbitrary key=value pairs into [Global] section only.
 
     Only replaces the value part after '=' for keys that already exist in [Global].
     Appends missing keys at the end of [Global] section to ensure new parameters persist.
+
+    Args:
+        values: Keys and values to write
+        root: Tk widget of the calling UI. When given, calls arriving within
+            ``_WRITE_DEBOUNCE_MS`` of each other are merged and written once
+            from that widget's event loop, so ``work_ini_changed`` is
+            published on the UI thread. Without it the write happens now.
+            ``flush_pending_writes`` forces a queued write.
     """
+    global _flush_job
     if not values:
         return
+    with _pending_ini_lock:
+        _pending_ini_values.update(values)
+        job = _flush_job
+        _flush_job = None
+    if root is None:
+        flush_pending_writes()
+        return
+    if job is not None:
+        try:
+            job[0].after_cancel(job[1])
+        except Exception:
+            pass
+    try:
+        after_id = root.after(_WRITE_DEBOUNCE_MS, flush_pending_writes)
+    except Exception:
+        # Widget already destroyed: no event loop left to defer to
+        flush_pending_writes()
+        return
+    with _pending_ini_lock:
+        _flush_job = (root, after_id)
+
+
+def flush_pending_writes() -> None:
+    """Write any values still queued by ``write_ini_values`` right away.
+
+    Readers and whole-file writers of work.ini call this first so they never
+    see (or get overwritten by) a stale batch. Safe to call at shutdown.
+    A scheduled flush that is superseded this way later finds nothing queued.
+    """
+    global _flush_job
+    with _flush_lock:
+        with _pending_ini_lock:
+            _flush_job = None
+            values = dict(_pending_ini_values)
+            _pending_ini_values.clear()
+        if not values:
+            return
+        written = _write_ini_values_now(values)
+    # Publish outside the lock: subscribers may call back into Tk
+    if written:
+        _publish_work_ini_changed()
+
+
+def _write_ini_values_now(values: dict[str, str]) -> bool:
+    """Apply ``values`` to work.ini immediately; return True when it changed."""
     work_path = _work_ini_path()
-    _seed_work_ini_from_template_if_missing()
-    current = _read_text(work_path)
+    current = _read_work_ini_for_update()
+    updated = _apply_global_values(current, values)
+    if updated is None:
+        # No [Global] section found - cannot write
+        return False
+    if updated == current:
+        # Values already on disk: skip the rewrite and the change event
+        return False
+
+    _write_text(work_path, updated)
+    return True
 
+
+def _apply_global_values(current: str, values: dict[str, str]) -> str | None:
+    """Return ``current`` with ``values`` written into its [Global] section.
+
+    Returns None when the text has no [Global] section.
+    """
     # Find [Global] section
     start_idx = current.find("[Global]")
     if start_idx < 0:
-        # No [Global] section found - cannot write
-        return
+        return None
 
     # Find end of [Global] section (next section starting with '[')
     rest_start = start_idx + len("[Global]")
@@ -340,55 +592,71 @@ def write_ini_values(values: dict[str, str]) -> None:
 
     # Reconstruct file
     before_global = current[:start_idx]
-    updated = before_global + updated_block + after_global
+    return before_global + updated_block + after_global
 
-    _write_text(work_path, updated)
-    _publish_work_ini_changed()
+
+def _apply_key_patches_to_bytes(data: bytes, values: dict[str, str]) -> bytes:
+    """Apply ``values`` to the [Global] section of raw UTF-8 INI ``data``.
+
+    Produces the same bytes as writing ``data`` and then calling
+    ``write_ini_values(values)`` on it (text-mode newline handling included).
+    Returns ``data`` unchanged when there is nothing to write or no [Global]
+    section.
+    """
+    if not values:
+        return data
+    text = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    updated = _apply_global_values(text, values)
+    if updated is None:
+        return data
+    return updated.replace("\n", os.linesep).encode("utf-8")
 
 
 # ---------------------------------------------------------------------------
 # Multiplayer settings helpers (comment toggle via leading ';')
 # ---------------------------------------------------------------------------
 
-# Match an INI key line with optional leading ';' (comment) and optional EOL
-_KEY_LINE_RX = re.compile(
-    r"^(?P<prefix>\s*;?\s*)(?P<key>[^#;=\s][^=\s]*?)\s*=\s*(?P<val>.*?)(?P<eol>(\r\n|\n|\r))?$"
+# Match an INI key line with optional leading ';' (comment), scanning a raw
+# bytes block in one pass
+_KEY_LINE_RX_B = re.compile(
+    rb"^(?P<prefix>[^\S\n]*;?[^\S\n]*)(?P<key>[^#;=\s][^=\s]*?)[^\S\n]*=[^\S\n]*(?P<val>[^\n]*)",
+    re.MULTILINE,
 )
 
 
+@lru_cache(maxsize=128)
+def _comment_state_rx(keys: frozenset[str]) -> re.Pattern[str]:
+    """Return a cached multiline pattern for whole ``[;] key = value`` lines of ``keys``.
+
+    Same line shape as ``_KEY_LINE_RX_B`` but restricted to the given keys, so
+    a block can be rewritten with a single ``sub`` pass.
+    """
+    alternation = "|".join(re.escape(k) for k in sorted(keys))
+    return re.compile(
+        rf"^[^\S\n]*;?[^\S\n]*(?P<key>{alternation})[^\S\n]*=[^\n]*(?P<eol>\n|\Z)",
+        re.MULTILINE,
+    )
+
+
 def read_keys_with_comment_state(keys: Sequence[str]) -> dict[str, Tuple[bool, str]]:
     """Return {key: (enabled, value)} for given keys from [Global] section only.
 
     enabled = True if line is not commented (no leading ';' before key), False otherwise.
     Only reads from [Global] section to avoid conflicts with mission-specific parameters.
     """
-    text = _read_text(_work_ini_path())
-    if not text:
-        return {k: (False, "") for k in keys}
-
-    # Extract [Global] section only
-    start_idx = text.find("[Global]")
-    if start_idx < 0:
-        return {k: (False, "") for k in keys}
-
-    # Find end of [Global] section (next section starting with '[')
-    rest = text[start_idx + len("[Global]"):]
-    end_idx = rest.find("\n[")
-    if end_idx >= 0:
-        block = rest[:end_idx]
-    else:
-        block = rest
-
+    flush_pending_writes()
     result: dict[str, Tuple[bool, str]] = {k: (False, "") for k in keys}
-    for line in block.splitlines(keepends=False):
-        m = _KEY_LINE_RX.match(line)
-        if not m:
-            continue
-        k = m.group('key').strip()
-        if k in result:
-            prefix = m.group('prefix')
-            enabled = ';' not in prefix.strip()  # if prefix has ';', treat as disabled
-            val = m.group('val').split(';', 1)[0].split('#', 1)[0].strip()
+    # Extract [Global] section only (bytes; only matched values are decoded)
+    block = _global_block_bytes(_read_bytes(_work_ini_path()))
+    if not block:
+        return result
+
+    wanted = {k.encode("utf-8"): k for k in result}
+    for m in _KEY_LINE_RX_B.finditer(block):
+        k = wanted.get(m.group('key'))
+        if k is not None:
+            enabled = b';' not in m.group('prefix')  # if prefix has ';', treat as disabled
+            val = m.group('val').split(b';', 1)[0].split(b'#', 1)[0].strip().decode("utf-8")
             result[k] = (enabled, val)
     return result
 
@@ -400,9 +668,9 @@ def write_keys_with_comment_state(settings: dict[str, Tuple[bool, str]]) -> None
     If enabled is True, remove leading ';' before the key.
     Only writes to [Global] section to avoid conflicts with mission-specific parameters.
     """
+    flush_pending_writes()
     path = _work_ini_path()
-    _seed_work_ini_from_template_if_missing()
-    text = _read_text(path)
+    text = _read_work_ini_for_update()
     if not text:
         return
 
@@ -426,26 +694,22 @@ def write_keys_with_comment_state(settings: dict[str, Tuple[bool, str]]) -> None
         global_block = text[start_idx:]
         after_global = ""
 
-    # Update lines in [Global] section only
-    lines = global_block.splitlines(keepends=True)
-    key_set = set(settings.keys())
-    for i, line in enumerate(lines):
-        m = _KEY_LINE_RX.match(line)
-        if not m:
-            continue
-        key = m.group('key').strip()
-        if key not in key_set:
-            continue
+    # Update lines in [Global] section only, in one pass over the block
+    def _replace(m: re.Match[str]) -> str:
+        key = m.group('key')
         enabled, value = settings[key]
-        eol = m.group('eol') if m.group('eol') else "\n"
-        # Build new line, adjusting comment mark
         # Build explicit prefix: add '; ' when disabled, nothing when enabled
         prefix = '' if enabled else '; '
-        lines[i] = f"{prefix}{key}={value}{eol}"
+        return f"{prefix}{key}={value}{m.group('eol') or chr(10)}"
+
+    if settings:
+        global_block = _comment_state_rx(frozenset(settings)).sub(_replace, global_block)
 
     # Reconstruct file
     before_global = text[:start_idx]
-    updated = before_global + "".join(lines) + after_global
+    updated = before_global + global_block + after_global
+    if updated == text:
+        return
 
     _write_text(path, updated)
     _publish_work_ini_changed()
@@ -467,7 +731,11 @@ def get_user_ui_info_from_mirror() -> dict[str, str]:
     writing legacy keys into INI. Falls back to DifficultyNameKey for Modname
     when UI_Modname missing.
     """
-    data = _read_mirror_dict()
+    return _ui_info_from_mirror_data(_read_mirror_dict())
+
+
+def _ui_info_from_mirror_data(data: dict[str, str]) -> dict[str, str]:
+    """Build the UI field dict from already-read mirror ``data``."""
     ui = {
         "Modname": data.get("UI_Modname", ""),
         "Version": data.get("UI_Version", ""),
@@ -491,6 +759,7 @@ def delete_user_info_mirror() -> None:
     """Delete the mirror file to reset preserved user fields on uninstall."""
     try:
         p = _user_info_path()
+        _FILE_WRITER.discard(p)
         if p.exists():
             p.unlink()
     except Exception:
@@ -498,12 +767,126 @@ def delete_user_info_mirror() -> None:
 
 
 def _write_bytes_atomic(dst: Path, data: bytes) -> None:
+    _forget_work_text(dst)
     dst.parent.mkdir(parents=True, exist_ok=True)
     tmp = dst.with_suffix(dst.suffix + ".tmp")
     tmp.write_bytes(data)
     os.replace(tmp, dst)
 
 
+class _BackgroundFileWriter:
+    """Single daemon thread performing atomic writes, last write wins per path.
+
+    ``submit`` returns immediately; the newest bytes for a path stay visible
+    through ``pending`` until they are on disk, so in-process readers never
+    observe an older state. Writes are temp-file + rename without fsync; the
+    files written are only fsynced once by ``sync`` at shutdown.
+    """
+
+    def __init__(self) -> None:
+        self._thread: threading.Thread | None = None
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._lock = threading.Lock()
+        self._pending: dict[Path, bytes] = {}
+        self._unsynced: set[Path] = set()
+
+    def _start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name="GMS-FileWriter", daemon=True)
+        self._thread.start()
+
+    def submit(self, path: Path, data: bytes) -> None:
+        with self._lock:
+            self._pending[path] = data
+            self._idle.clear()
+        self._start()
+        self._wake.set()
+
+    def pending(self, path: Path) -> bytes | None:
+        with self._lock:
+            return self._pending.get(path)
+
+    def discard(self, path: Path) -> None:
+        """Drop a queued write for ``path`` and wait until no write is in flight."""
+        with self._lock:
+            self._pending.pop(path, None)
+        self.flush()
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """Block until every queued write has reached the disk."""
+        t = self._thread
+        if t and t.is_alive():
+            self._idle.wait(timeout)
+
+    def sync(self) -> None:
+        """Flush queued writes and fsync every file written since the last sync."""
+        self.flush()
+        with self._lock:
+            paths, self._unsynced = self._unsynced, set()
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDWR)
+            except OSError:
+                continue
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        self._idle.set()
+                        break
+                    path, data = next(iter(self._pending.items()))
+                try:
+                    _write_bytes_atomic(path, data)
+                except OSError:
+                    # Keep the worker alive; the entry is dropped below
+                    pass
+                else:
+                    with self._lock:
+                        self._unsynced.add(path)
+                with self._lock:
+                    # A newer submit for the same path stays queued
+                    if self._pending.get(path) is data:
+                        del self._pending[path]
+
+
+_FILE_WRITER = _BackgroundFileWriter()
+atexit.register(_FILE_WRITER.sync)
+# Registered last so it runs first: queued edits are written before the sync
+atexit.register(flush_pending_writes)
+
+
+# Robuste Pfad-Ermittlung, die sowohl in Entwicklung als auch in kompilierten Builds funktioniert.
+@lru_cache(maxsize=1)
+def _application_root() -> Path:
+    """
+    Ermittelt das Basisverzeichnis der Anwendung, egal ob als Skript oder als kompilierte EXE ausgeführt.
+    """
+    if getattr(sys, 'frozen', False):
+        # In a frozen build, the base path is the directory of the executable.
+        return Path(sys.executable).resolve().parent
+    else:
+        # In a development environment, walk up from this file until we find the 'system' folder.
+        # This is more robust than checking for 'StrategoAI_Live_Generator.py'.
+        p = Path(__file__).resolve().parent
+        for parent in p.parents:
+            if (parent / 'system').is_dir():
+                return parent
+        raise FileNotFoundError("Could not locate application base path.")
+
+
 def start_fresh_action(label: str | None = None) -> None:
     """Overwrite the user's work.ini with a small Start-Fresh template.
 
@@ -513,37 +896,23 @@ def start_fresh_action(label: str | None = None) -> None:
     - Destination is the Ready or Not work.ini under LOCALAPPDATA.
     - Always overwrites the destination file.
     """
+    global _work_ini_seeded
+    flush_pending_writes()
     # Normalize label
     normalized = (label or "Standard").strip().title()
     if normalized not in {"Casual", "Standard", "Hard"}:
         normalized = "Standard"
 
-    # Robuste Pfad-Ermittlung, die sowohl in Entwicklung als auch in kompilierten Builds funktioniert.
-    def get_application_base_path() -> Path:
-        """
-        Ermittelt das Basisverzeichnis der Anwendung, egal ob als Skript oder als kompilierte EXE ausgeführt.
-        """
-        if getattr(sys, 'frozen', False):
-            # In a frozen build, the base path is the directory of the executable.
-            return Path(sys.executable).resolve().parent
-        else:
-            # In a development environment, walk up from this file until we find the 'system' folder.
-            # This is more robust than checking for 'StrategoAI_Live_Generator.py'.
-            p = Path(__file__).resolve().parent
-            for parent in p.parents:
-                if (parent / 'system').is_dir():
-                    return parent
-            raise FileNotFoundError("Could not locate application base path.")
-
-    root = get_application_base_path()
+    root = _application_root()
     src = root / "system" / "templates" / "start_fresh" / normalized / "work.ini"
-    if not src.exists():
-        raise FileNotFoundError(f"Start fresh template not found: {src}")
+    try:
+        data = _cached_template_bytes(src)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Start fresh template not found: {src}") from None
 
     dst = _work_ini_path()
-    data = src.read_bytes()
-    _write_bytes_atomic(dst, data)
-    # After replacing, restore Modname and Version from mirror if available
+    # Restore Modname and Version from mirror if available; patched into the
+    # template in memory so work.ini is written (and its mtime bumped) once
     try:
         mirror_vals = _read_user_info_from_mirror()
         restore: dict[str, str] = {}
@@ -553,33 +922,18 @@ def start_fresh_action(label: str | None = None) -> None:
             restore["Modname"] = mod
         if ver:
             restore["Version"] = ver
-        if restore:
-            write_ini_values(restore)
+        data = _apply_key_patches_to_bytes(data, restore)
     except Exception:
         # Non-fatal: if mirror missing or parse failed, continue
         pass
-    # Touch to ensure any external watcher reacts
-    try:
-        os.utime(dst, None)
-    except Exception:
-        pass
+    _write_bytes_atomic(dst, data)
+    _work_ini_seeded = False
     # Publish reset event to trigger full UI rebuild
-    try:
-        if _event_bus is not None:
-            _event_bus.publish("work_ini_reset")
-    except Exception:
-        pass
+    _publish_work_ini_reset()
     _publish_work_ini_changed()
     # After start fresh, force a new code/tag based on current UI values
     try:
-        _purge_mapping_keys_from_mirror()
-        ui = get_user_ui_info_from_mirror()
-        mod = ui.get("Modname", "")
-        ver = ui.get("Version", "")
-        dt = ui.get("Date", "")
-        nt = ui.get("Notes", "")
-        if mod:
-            apply_modname_mappings(mod, ver, dt, nt)
+        _rebuild_mapping_atomically()
     except Exception:
         pass
 
@@ -621,46 +975,34 @@ def clean_all_action() -> None:
     Steps:
     - Delete repo-local user_mission_info.json (mirror)
     - Copy system/templates/clean_all_ini/work.ini over the active Work/work.ini
-    - Ensure destination directories exist
-    - Touch the destination to update mtime so any watchers refresh
+    - Ensure destination directories exist (the atomic replace updates mtime
+      so any watchers refresh)
     """
+    global _work_ini_seeded
+    flush_pending_writes()
     # Remove mirror file
     try:
         p = _user_info_path()
+        _FILE_WRITER.discard(p)
         if p.exists():
             p.unlink()
     except Exception:
         pass
 
     # Resolve source clean template
+    src = _app_base_path() / "system" / "templates" / "clean_all_ini" / "work.ini"
     try:
-        from system.config_main.main_actions import get_application_base_path
-        base = get_application_base_path()
-    except Exception:
-        # Fallback for development environments
-        base = Path(__file__).resolve().parents[5]
-
-    src = base / "system" / "templates" / "clean_all_ini" / "work.ini"
-    if not src.exists():
-        raise FileNotFoundError(f"Clean template not found: {src}")
+        data = _cached_template_bytes(src)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Clean template not found: {src}") from None
 
     # Destination work.ini
     dst = _work_ini_path()
-    data = src.read_bytes()
     _write_bytes_atomic(dst, data)
-    
-    # Touch to ensure any external watcher reacts
-    try:
-        os.utime(dst, None)
-    except Exception:
-        pass
-    
+    _work_ini_seeded = False
+
     # Publish reset event to trigger full UI rebuild
-    try:
-        if _event_bus is not None:
-            _event_bus.publish("work_ini_reset")
-    except Exception:
-        pass
+    _publish_work_ini_reset()
     _publish_work_ini_changed()
 
 
@@ -696,29 +1038,53 @@ __all__ = [
     "get_user_ui_info_from_mirror",
     "remove_all_traps_action",
     "remove_all_bombs_action",
+    "flush_pending_writes",
 ]
 
 # ---------------------- Difficulty helpers (minimal, safe) -------------------
-def _find_section_exact(text: str, header: str) -> tuple[int, int]:
+_INFO_HEADER = "[Info]"
+_GAMEPLAY_TAGS_HEADER = "[/Script/GameplayTags.GameplayTagsList]"
+
+# Start of any section header line (leading blanks allowed)
+_SECTION_START_RX = re.compile(r"^[^\S\r\n]*\[", re.MULTILINE)
+_SECTION_START_RX_B = re.compile(rb"^[^\S\r\n]*\[", re.MULTILINE)
+# Same section-start lines, capturing the header text for _index_sections
+_SECTION_LINE_RX = re.compile(r"^[^\S\r\n]*(?P<hdr>\[[^\r\n]*)", re.MULTILINE)
+# Value of the first DifficultyGameplayTag* line (not commented), on raw bytes
+_DIFFTAG_RX_B = re.compile(rb"^[^\S\n]*difficultygameplaytag[^=\n]*=(?P<val>[^\n]*)", re.IGNORECASE | re.MULTILINE)
+
+# Difficulty label -> small [Info]/GameplayTags template in templates/build
+_DIFFICULTY_INFO_TEMPLATES = {
+    "Casual": "Casual_Info.ini",
+    "Standard": "Standard_Info.ini",
+    "Hard": "Hard_Info.ini",
+}
+
+
+@lru_cache(maxsize=16)
+def _section_header_rx(header: AnyStr) -> re.Pattern[AnyStr]:
+    """Return the cached pattern for a whole line equal to ``header`` (blanks allowed)."""
+    if isinstance(header, bytes):
+        return re.compile(
+            rb"^[^\S\r\n]*" + re.escape(header) + rb"[^\S\r\n]*(?:\r\n|\n|\r|\Z)", re.MULTILINE
+        )
+    return re.compile(
+        rf"^[^\S\r\n]*{re.escape(header)}[^\S\r\n]*(?:\r\n|\n|\r|\Z)", re.MULTILINE
+    )
+
+
+def _find_section_exact(text: AnyStr, header: AnyStr) -> tuple[int, int]:
     """Return (start,end) byte positions of a section by exact header line.
 
     End is right before the next line that begins with '[' or EOF. (-1,-1) if missing.
+    Accepts str or raw bytes (``text`` and ``header`` of the same type).
     """
-    lines = text.splitlines(keepends=True)
-    pos = 0
-    for i, line in enumerate(lines):
-        if line.strip() == header:
-            start = pos
-            j = i + 1
-            end = pos + len(line)
-            while j < len(lines):
-                if lines[j].lstrip().startswith("["):
-                    break
-                end += len(lines[j])
-                j += 1
-            return start, end
-        pos += len(line)
-    return -1, -1
+    m = _section_header_rx(header).search(text)
+    if m is None:
+        return -1, -1
+    start_rx = _SECTION_START_RX_B if isinstance(text, bytes) else _SECTION_START_RX
+    nxt = start_rx.search(text, m.end())
+    return m.start(), (nxt.start() if nxt is not None else len(text))
 
 
 def get_current_difficulty_from_work() -> str:
@@ -730,24 +1096,21 @@ def get_current_difficulty_from_work() -> str:
     - If tag contains '.Hard' anywhere, return Hard.
     - Otherwise default to Standard.
     """
-    text = _read_text(_work_ini_path())
-    if not text:
+    flush_pending_writes()
+    data = _read_bytes(_work_ini_path())
+    if not data:
         return "Standard"
-    s, e = _find_section_exact(text, "[Info]")
-    block = text[s:e] if s >= 0 else text
-    for raw in block.splitlines():
-        line = raw.strip()
-        if not line or "=" not in line:
-            continue
-        if line.lower().startswith("difficultygameplaytag"):
-            tag = line.split("=", 1)[1].strip().replace(" ", "")
-            if tag.lower() == "difficulty.standard":
-                return "Standard"
-            if ".casual" in tag.lower():
-                return "Casual"
-            if ".hard" in tag.lower():
-                return "Hard"
-            return "Standard"
+    s, e = _find_section_exact(data, b"[Info]")
+    m = _DIFFTAG_RX_B.search(data, s, e) if s >= 0 else _DIFFTAG_RX_B.search(data)
+    if m is None:
+        return "Standard"
+    tag = m.group("val").decode("utf-8").strip().replace(" ", "").lower()
+    if tag == "difficulty.standard":
+        return "Standard"
+    if ".casual" in tag:
+        return "Casual"
+    if ".hard" in tag:
+        return "Hard"
     return "Standard"
 
 
@@ -758,30 +1121,23 @@ def apply_difficulty_to_work(label: str) -> None:
     if missing, inserts [Info] once at the top. GameplayTags block is replaced when
     present or appended once if missing. No other content is changed.
     """
-    name = {"Casual": "Casual_Info.ini", "Standard": "Standard_Info.ini", "Hard": "Hard_Info.ini"}.get(label)
+    flush_pending_writes()
+    name = _DIFFICULTY_INFO_TEMPLATES.get(label)
     if not name:
         return
-    try:
-        from system.config_main.main_actions import get_application_base_path
-        root = get_application_base_path()
-    except Exception:
-        return
-    tpl_path = root / "system" / "templates" / "build" / name
-    if not tpl_path.exists():
-        return
-    tpl = _read_text(tpl_path)
-    i_s, i_e = _find_section_exact(tpl, "[Info]")
-    t_s, t_e = _find_section_exact(tpl, "[/Script/GameplayTags.GameplayTagsList]")
+    tpl = _read_template_text(_app_base_path() / "system" / "templates" / "build" / name)
+    i_s, i_e = _find_section_exact(tpl, _INFO_HEADER)
+    t_s, t_e = _find_section_exact(tpl, _GAMEPLAY_TAGS_HEADER)
     info_block = tpl[i_s:i_e] if i_s >= 0 else ""
     tags_block = tpl[t_s:t_e] if t_s >= 0 else ""
     if not info_block and not tags_block:
         return
     work_path = _work_ini_path()
-    text = _read_text(work_path)
+    text = _read_work_text(work_path)
     changed = False
     # Replace [Info] or insert once at top
     if info_block:
-        s2, e2 = _find_section_exact(text, "[Info]")
+        s2, e2 = _find_section_exact(text, _INFO_HEADER)
         if s2 >= 0:
             text = text[:s2] + info_block + text[e2:]
             changed = True
@@ -792,7 +1148,7 @@ def apply_difficulty_to_work(label: str) -> None:
             changed = True
     # GameplayTags replace or append once
     if tags_block:
-        s3, e3 = _find_section_exact(text, "[/Script/GameplayTags.GameplayTagsList]")
+        s3, e3 = _find_section_exact(text, _GAMEPLAY_TAGS_HEADER)
         if s3 >= 0:
             text = text[:s3] + tags_block + text[e3:]
             changed = True
@@ -803,55 +1159,132 @@ def apply_difficulty_to_work(label: str) -> None:
     if changed:
         _write_text(work_path, text)
         # Publish reset event when difficulty changes (full UI rebuild needed)
-        try:
-            if _event_bus is not None:
-                _event_bus.publish("work_ini_reset")
-        except Exception:
-            pass
+        _publish_work_ini_reset()
         _publish_work_ini_changed()
         # Auto-regenerate code/tag to match new difficulty using current UI values
         try:
-            _purge_mapping_keys_from_mirror()
-            ui = get_user_ui_info_from_mirror()
-            mod = ui.get("Modname", "")
-            ver = ui.get("Version", "")
-            dt = ui.get("Date", "")
-            nt = ui.get("Notes", "")
-            if mod:
-                apply_modname_mappings(mod, ver, dt, nt)
+            _rebuild_mapping_atomically()
         except Exception:
             pass
 
 
 # ----------------------- Modname mapping helpers ----------------------------
 
+# Deletes every ASCII character that is not a letter
+_NON_ALPHA_ASCII = str.maketrans("", "", "".join(ch for ch in map(chr, range(128)) if not ch.isalpha()))
+
+
 def _letters_only(s: str) -> str:
     try:
-        return "".join(ch for ch in s if ch.isalpha())
+        out = s.translate(_NON_ALPHA_ASCII)
+        if out.isascii():
+            return out
+        # Non-ASCII left over: filter the remaining characters one by one
+        return "".join(ch for ch in out if ch.isalpha())
     except Exception:
         return s
 
 
+# Mirror key order on write: UI keys first, then mappings, then alpha of the rest
+_MIRROR_UI_KEYS = ("UI_Modname", "UI_Version", "UI_Date", "UI_Notes")
+_MIRROR_MAPPING_KEYS = (
+    "CodePrefix",
+    "CodeNumber",
+    "DifficultyNameKey",
+    "DifficultySubtextKey",
+    "DifficultyGameplayTag",
+    "GameplayTag",
+    "DifficultyFlavorKey",
+)
+_MIRROR_FIXED_ORDER = _MIRROR_UI_KEYS + _MIRROR_MAPPING_KEYS
+_MIRROR_FIXED_KEYS = frozenset(_MIRROR_FIXED_ORDER)
+
+# Last parsed mirror: (source, data). Lets repeated reads of an unchanged
+# file skip the text parse; refreshed by every mirror write. The source is
+# the file's (path, mtime_ns, size) stamp, or the bytes object still queued
+# on _FILE_WRITER when the newest content has not landed yet
+_mirror_cache: tuple[tuple[str, int, int] | bytes, dict[str, str]] | None = None
+# Guards replacing _mirror_cache so a slow read cannot undo a newer write
+_mirror_lock = threading.Lock()
+
+
+# One mirror line: key (up to the first '=') and the raw value after it
+_MIRROR_LINE_RX = re.compile(r"^([^=\n]*)=(.*)$", re.MULTILINE)
+
+
+def _parse_mirror_text(text: str) -> dict[str, str]:
+    # findall does the line splitting and '=' partitioning in one C-level pass
+    return {k.strip(): v for k, v in _MIRROR_LINE_RX.findall(text)}
+
+
+def _mirror_stamp(path: Path) -> tuple[str, int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
 def _read_mirror_dict() -> dict[str, str]:
-    text = _read_text(_user_info_path())
-    data: dict[str, str] = {}
-    if not text:
-        return data
-    for line in text.splitlines():
-        if "=" not in line:
-            continue
-        k, v = line.split("=", 1)
-        data[k.strip()] = v
-    return data
+    """Return a fresh copy of the mirror's key/value pairs (cached by mtime/size)."""
+    global _mirror_cache
+    path = _user_info_path()
+    cached = _mirror_cache
+    queued = _FILE_WRITER.pending(path)
+    if queued is not None:
+        # The newest content has not landed yet: serve it, not the older file
+        if cached is not None and cached[0] is queued:
+            return dict(cached[1])
+        source: tuple[str, int, int] | bytes = queued
+        text = queued.decode("utf-8").replace(os.linesep, "\n")
+    else:
+        stamp = _mirror_stamp(path)
+        if stamp is None:
+            return {}
+        if cached is not None and cached[0] == stamp:
+            return dict(cached[1])
+        source = stamp
+        text = _read_text(path)
+    data = _parse_mirror_text(text)
+    with _mirror_lock:
+        # A write that stored its content meanwhile wins over this read
+        if _mirror_cache is cached:
+            _mirror_cache = (source, data)
+    return dict(data)
+
+
+def _write_mirror_dict(data: dict[str, str]) -> None:
+    """Serialize ``data`` to the mirror file in canonical key order.
+
+    The write itself happens on the background file writer; the cache serves
+    the new content to readers until it has landed.
+    """
+    global _mirror_cache
+    path = _user_info_path()
+    # Keys outside the fixed order; usually none, so the sort is normally skipped
+    extras = data.keys() - _MIRROR_FIXED_KEYS
+    rest = sorted(extras) if extras else ()
+    lines = [f"{k}={data[k]}" for k in _MIRROR_FIXED_ORDER if k in data]
+    lines.extend(f"{k}={data[k]}" for k in rest)
+    content = "\n".join(lines) + "\n" if lines else ""
+    # Same bytes that write_text() would produce (text-mode newline translation)
+    queued = content.replace("\n", os.linesep).encode("utf-8")
+    # Queue first: from here on readers serve these bytes, whatever the cache holds
+    _FILE_WRITER.submit(path, queued)
+    with _mirror_lock:
+        _mirror_cache = (queued, _parse_mirror_text(content))
+
+# Any line break (CRLF, CR or LF)
+_ENC_NL = re.compile(r"\r\n?|\n")
+
 
 def _encode_multiline(val: str) -> str:
     """Encode multiline text for single-line key=value storage.
 
-    Converts CRLF/CR to LF, then replaces LF with literal \n.
+    Replaces every CRLF/CR/LF with literal \n in a single pass.
     """
     try:
-        s = str(val or "").replace("\r\n", "\n").replace("\r", "\n")
-        return s.replace("\n", r"\n")
+        return _ENC_NL.sub(r"\\n", str(val or ""))
     except Exception:
         return str(val) if val is not None else ""
 
@@ -866,21 +1299,11 @@ def _decode_multiline(val: str) -> str:
 
 def _write_mirror_merge(values: dict[str, str]) -> None:
     """Merge provided key/values into mirror file without removing others."""
-    path = _user_info_path()
     current = _read_mirror_dict()
-    current.update({k: str(v) for k, v in (values or {}).items()})
-    # Order: UI keys first, then mappings, then alpha of the rest
-    ui_keys = ["UI_Modname", "UI_Version", "UI_Date", "UI_Notes"]
-    mapping_keys = ["CodePrefix", "CodeNumber", "DifficultyNameKey", "DifficultySubtextKey", "DifficultyGameplayTag", "GameplayTag", "DifficultyFlavorKey"]
-    keys = ui_keys + mapping_keys + sorted([k for k in current.keys() if k not in ui_keys and k not in mapping_keys])
-    seen = set()
-    lines: list[str] = []
-    for k in keys:
-        if k in current and k not in seen:
-            lines.append(f"{k}={current[k]}")
-            seen.add(k)
-    content = "\n".join(lines) + "\n"
-    _write_text(path, content)
+    merged = {**current, **{k: str(v) for k, v in (values or {}).items()}}
+    if current and merged == current:
+        return
+    _write_mirror_dict(merged)
 
 
 def _purge_legacy_keys_from_mirror() -> None:
@@ -888,7 +1311,6 @@ def _purge_legacy_keys_from_mirror() -> None:
     
     These keys should never exist in the mirror file. Only UI_* keys are allowed.
     """
-    path = _user_info_path()
     data = _read_mirror_dict()
     changed = False
     for k in _LEGACY_USER_KEYS:
@@ -898,17 +1320,11 @@ def _purge_legacy_keys_from_mirror() -> None:
     if not changed:
         return
     # Re-write without the legacy keys
-    ui_keys = ["UI_Modname", "UI_Version", "UI_Date", "UI_Notes"]
-    mapping_keys = ["CodePrefix", "CodeNumber", "DifficultyNameKey", "DifficultySubtextKey", "DifficultyGameplayTag", "GameplayTag", "DifficultyFlavorKey"]
-    keys = ui_keys + mapping_keys + sorted([k for k in data.keys() if k not in ui_keys and k not in mapping_keys])
-    seen = set()
-    lines: list[str] = []
-    for k in keys:
-        if k in data and k not in seen:
-            lines.append(f"{k}={data[k]}")
-            seen.add(k)
-    content = "\n".join(lines) + "\n" if lines else ""
-    _write_text(path, content)
+    _write_mirror_dict(data)
+
+
+# Mapping keys dropped to force a new code/tag on the next apply
+_MIRROR_CODE_KEYS = ("CodePrefix", "CodeNumber", "DifficultyGameplayTag", "GameplayTag")
 
 
 def _purge_mapping_keys_from_mirror() -> None:
@@ -916,29 +1332,46 @@ def _purge_mapping_keys_from_mirror() -> None:
 
     Keys: CodePrefix, CodeNumber, DifficultyGameplayTag, GameplayTag
     """
-    path = _user_info_path()
     data = _read_mirror_dict()
     changed = False
-    for k in ("CodePrefix", "CodeNumber", "DifficultyGameplayTag", "GameplayTag"):
+    for k in _MIRROR_CODE_KEYS:
         if k in data:
             del data[k]
             changed = True
     if not changed:
         return
-    # Re-write remaining keys with the same ordering rules as _write_mirror_merge
-    ui_keys = ["UI_Modname", "UI_Version", "UI_Date", "UI_Notes"]
-    mapping_keys = ["CodePrefix", "CodeNumber", "DifficultyNameKey", "DifficultySubtextKey", "DifficultyGameplayTag", "GameplayTag", "DifficultyFlavorKey"]
-    keys = ui_keys + mapping_keys + sorted([k for k in data.keys() if k not in ui_keys and k not in mapping_keys])
-    seen = set()
-    lines: list[str] = []
-    for k in keys:
-        if k in data and k not in seen:
-            lines.append(f"{k}={data[k]}")
-            seen.add(k)
-    content = "\n".join(lines) + "\n" if lines else ""
-    _write_text(path, content)
+    _write_mirror_dict(data)
+
 
-def _generate_code_for_modname(modname: str) -> tuple[str, int]:
+def _rebuild_mapping_atomically(fallback: dict[str, str] | None = None) -> None:
+    """Purge the stored code/tag and regenerate it from the mirrored UI values.
+
+    Equivalent to ``_purge_mapping_keys_from_mirror()`` followed by
+    ``apply_modname_mappings(...)`` with the mirrored Modname/Version/Date/Notes,
+    but reads and writes the mirror only once. ``fallback`` supplies
+    Modname/Version when the mirror has none.
+    """
+    data = _read_mirror_dict()
+    changed = False
+    for k in _MIRROR_CODE_KEYS:
+        if k in data:
+            del data[k]
+            changed = True
+    try:
+        ui = _ui_info_from_mirror_data(data)
+        fallback = fallback or {}
+        mod = ui.get("Modname", "") or fallback.get("Modname", "")
+        ver = ui.get("Version", "") or fallback.get("Version", "")
+        if mod:
+            _apply_modname_mappings_to(data, mod, ver, ui.get("Date", ""), ui.get("Notes", ""))
+            changed = True
+    finally:
+        # The purge persists even if regenerating the mapping failed
+        if changed:
+            _write_mirror_dict(data)
+
+
+def _generate_code_for_modname(modname: str, mirror: dict[str, str] | None = None) -> tuple[str, int]:
     """Return (prefix, number) where prefix is 3 letters from modname and
     number is 1..999 not equal to the last used for this prefix.
     The last used number is read from mirror via CodePrefix/CodeNumber if the
@@ -954,7 +1387,8 @@ def _generate_code_for_modname(modname: str) -> tuple[str, int]:
         p = "MOD"
     # Capitalize like example: Rea from RealLife
     prefix = p[0:1].upper() + p[1:].lower()
-    mirror = _read_mirror_dict()
+    if mirror is None:
+        mirror = _read_mirror_dict()
     last_prefix = mirror.get("CodePrefix", "")
     last_number = 0
     try:
@@ -962,11 +1396,14 @@ def _generate_code_for_modname(modname: str) -> tuple[str, int]:
             last_number = int(mirror.get("CodeNumber", "0") or 0)
     except Exception:
         last_number = 0
-    # pick random 1..999 not equal to last_number
-    n = random.randint(1, 999)
-    if last_number and n == last_number:
-        # minimal retry once
-        n = 1 if n != 1 else 2
+    # pick random 1..999 not equal to last_number, uniformly: draw from the
+    # 998 remaining values and shift the ones at/above last_number up by one
+    if 1 <= last_number <= 999:
+        n = random.randint(1, 998)
+        if n >= last_number:
+            n += 1
+    else:
+        n = random.randint(1, 999)
     return prefix, n
 
 
@@ -990,19 +1427,20 @@ def _build_subtext_value(display_name: str, notes_text: str | None = None) -> st
     if notes_text is None:
         bullets = ["", "", "", ""]
     else:
-        norm = str(notes_text).replace("\r\n", "\n").replace("\r", "\n")
-        lines = norm.split("\n")
+        # splitlines() handles CRLF/CR/LF in one pass
+        lines = str(notes_text).splitlines()
         # ensure exactly 4 entries
         bullets = [lines[i] if i < len(lines) else "" for i in range(4)]
-    # Build with literal CRLF sequences inside the quoted string
-    sub = (
-        '"'
-        + safe_name
-        + "\\r\\n\\r\\n"
-        + "\\r\\n".join([f"<grey.semibold>• {bullets[i]}</>" for i in range(4)])
-        + '"'
+    b0, b1, b2, b3 = bullets
+    # Build with literal CRLF sequences inside the quoted string; always exactly
+    # four bullets, so a single f-string avoids the list + join.
+    return (
+        f'"{safe_name}\\r\\n\\r\\n'
+        f"<grey.semibold>• {b0}</>\\r\\n"
+        f"<grey.semibold>• {b1}</>\\r\\n"
+        f"<grey.semibold>• {b2}</>\\r\\n"
+        f'<grey.semibold>• {b3}</>"'
     )
-    return sub
 
 
 def _format_flavor_value(date_str: str) -> str:
@@ -1015,84 +1453,144 @@ def _format_flavor_value(date_str: str) -> str:
     return '"' + f"<italic>“{safe}”</>" + '"'
 
 
-def _update_info_block_with_modname(text: str, display_name: str, tag_value: str, flavor_value: str | None = None, notes_text: str | None = None) -> str:
+# [Info] keys rewritten by _update_info_block_with_modname, one whole line each
+_INFO_MAPPING_LINE_RX = re.compile(
+    r"^[^\S\n]*(?P<key>DifficultyNameKey|DifficultySubtextKey|DifficultyGameplayTag|DifficultyFlavorKey)"
+    r"[^\S\n]*=[^\n]*(?:\n|\Z)",
+    re.MULTILINE,
+)
+# First GameplayTagList entry pointing at a Difficulty.* tag
+_DIFFICULTY_TAG_LINE_RX = re.compile(
+    r'^[^\S\n]*GameplayTagList=[^\n]*Tag="Difficulty\.[^\n]*\n?',
+    re.MULTILINE,
+)
+
+
+def _detect_eol(text: str) -> str:
+    """Return the document's line terminator, judged from its first line.
+
+    INI files written by the game and by this tool use one EOL throughout,
+    so the terminator of the first line (looked for in the first 4 KiB)
+    decides; the rest of the document is never scanned.
+    """
+    nl = text.find("\n", 0, 4096)
+    return "\r\n" if nl > 0 and text[nl - 1] == "\r" else "\n"
+
+
+def _index_sections(text: str) -> dict[str, tuple[int, int]]:
+    """Return {header line: (start, end)} for every section in one pass.
+
+    Same ranges as ``_find_section_exact``: the first occurrence of a header
+    wins and a section ends right before the next line that begins with '['.
+    """
+    starts = [(m.start(), m.group("hdr").rstrip()) for m in _SECTION_LINE_RX.finditer(text)]
+    index: dict[str, tuple[int, int]] = {}
+    for i, (pos, hdr) in enumerate(starts):
+        if hdr not in index:
+            index[hdr] = (pos, starts[i + 1][0] if i + 1 < len(starts) else len(text))
+    return index
+
+
+def _update_mapping_sections(text: str, display_name: str, tag_value: str, flavor_value: str | None = None, notes_text: str | None = None) -> str:
+    """Apply ``_update_info_block_with_modname`` and ``_update_gameplay_tag_list``.
+
+    Sections are located once. When both exist, each edit is computed as a
+    (start, end, replacement) splice on the original text and the result is
+    assembled in a single join instead of copying the whole text per edit.
+    """
+    index = _index_sections(text)
+    info = index.get(_INFO_HEADER)
+    tags = index.get(_GAMEPLAY_TAGS_HEADER)
+    if info is None or tags is None:
+        # First run: a section gets created; fall back to the stepwise update
+        updated = _update_info_block_with_modname(text, display_name, tag_value, flavor_value, notes_text, span=info or (-1, -1))
+        return _update_gameplay_tag_list(updated, tag_value)
+    eol = _detect_eol(text)
+    edits = sorted((
+        (info[0], info[1], _info_section_body(text, info, display_name, tag_value, flavor_value, notes_text, eol)),
+        _gameplay_tag_splice(text, tags, tag_value, eol),
+    ))
+    parts: list[str] = []
+    pos = 0
+    for start, end, replacement in edits:
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def _info_section_body(text: str, span: tuple[int, int], display_name: str, tag_value: str, flavor_value: str | None, notes_text: str | None, eol: str) -> str:
+    """Return the rewritten [Info] section ``text[span[0]:span[1]]``."""
+    values = {
+        "DifficultyNameKey": display_name,
+        "DifficultySubtextKey": _build_subtext_value(display_name, notes_text),
+        "DifficultyGameplayTag": tag_value,
+    }
+    # Replacement lines are built once; a key maps to its new line, so each
+    # matched line costs one dict probe. Flavor is only rewritten when given.
+    lines = {k: f"{k}={v}{eol}" for k, v in values.items()}
+    if flavor_value is not None:
+        lines["DifficultyFlavorKey"] = f"DifficultyFlavorKey={flavor_value}{eol}"
+    seen: set[str] = set()
+
+    # Only the mapping lines of [Info] are visited and rebuilt; the rest of
+    # the section is copied through by the regex engine
+    def _replace(m: re.Match[str]) -> str:
+        key = m.group("key")
+        seen.add(key)
+        return lines.get(key) or m.group(0)
+
+    block = _INFO_MAPPING_LINE_RX.sub(_replace, text[span[0]:span[1]])
+    # append missing at end of section block (before closing)
+    missing = [lines[k] for k in values if k not in seen]
+    if missing:
+        if flavor_value is not None:
+            missing.append(lines["DifficultyFlavorKey"])
+        block += "".join(missing)
+    return block
+
+
+def _gameplay_tag_splice(text: str, span: tuple[int, int], tag_value: str, eol: str) -> tuple[int, int, str]:
+    """Return (start, end, replacement) that points the GameplayTags block at ``tag_value``."""
+    line_tpl = f"GameplayTagList=(Tag=\"{tag_value}\",DevComment=\"\"){eol}"
+    m = _DIFFICULTY_TAG_LINE_RX.search(text, span[0], span[1])
+    if m is None:
+        # append one line
+        return span[1], span[1], line_tpl
+    return m.start(), m.end(), line_tpl
+
+
+def _update_info_block_with_modname(text: str, display_name: str, tag_value: str, flavor_value: str | None = None, notes_text: str | None = None, *, span: tuple[int, int] | None = None) -> str:
     """Replace DifficultyNameKey, DifficultySubtextKey and DifficultyGameplayTag in [Info].
     If keys are missing, append them at the end of the section.
+    ``span`` is the section's precomputed (start, end), if already known.
     """
-    s, e = _find_section_exact(text, "[Info]")
+    eol = _detect_eol(text)
+    s, e = span if span is not None else _find_section_exact(text, _INFO_HEADER)
     if s < 0:
         # Insert a minimal [Info] at top
-        eol = "\n" if ("\r\n" not in text) else "\r\n"
         block = f"[Info]{eol}DifficultyNameKey={display_name}{eol}DifficultySubtextKey={_build_subtext_value(display_name, notes_text)}{eol}DifficultyGameplayTag={tag_value}{eol}"
         if flavor_value is not None:
             block += f"DifficultyFlavorKey={flavor_value}{eol}"
-        return block + ("\n" + text if text else "")
-    block = text[s:e]
-    lines = block.splitlines(keepends=True)
-    keys = {"DifficultyNameKey": False, "DifficultySubtextKey": False, "DifficultyGameplayTag": False}
-    for i, ln in enumerate(lines):
-        raw = ln.strip()
-        if not raw or raw.startswith(('#', ';', '[')) or '=' not in raw:
-            continue
-        k = raw.split('=', 1)[0].strip()
-        eol = "\n" if ln.endswith("\n") else ("\r\n" if ln.endswith("\r\n") else "\n")
-        if k == "DifficultyNameKey":
-            lines[i] = f"DifficultyNameKey={display_name}{eol}"
-            keys["DifficultyNameKey"] = True
-        elif k == "DifficultySubtextKey":
-            lines[i] = f"DifficultySubtextKey={_build_subtext_value(display_name, notes_text)}{eol}"
-            keys["DifficultySubtextKey"] = True
-        elif k == "DifficultyGameplayTag":
-            lines[i] = f"DifficultyGameplayTag={tag_value}{eol}"
-            keys["DifficultyGameplayTag"] = True
-        elif k == "DifficultyFlavorKey" and flavor_value is not None:
-            lines[i] = f"DifficultyFlavorKey={flavor_value}{eol}"
-            # keep keys map as-is; not tracked for all()
-    # append missing at end of section block (before closing)
-    if not all(keys.values()):
-        insert_at = len(lines)
-        add_eol = "\n"
-        if lines:
-            add_eol = "\n" if lines[-1].endswith("\n") else ("\r\n" if lines[-1].endswith("\r\n") else "\n")
-        extra: list[str] = []
-        if not keys["DifficultyNameKey"]:
-            extra.append(f"DifficultyNameKey={display_name}{add_eol}")
-        if not keys["DifficultySubtextKey"]:
-            extra.append(f"DifficultySubtextKey={_build_subtext_value(display_name, notes_text)}{add_eol}")
-        if not keys["DifficultyGameplayTag"]:
-            extra.append(f"DifficultyGameplayTag={tag_value}{add_eol}")
-        if flavor_value is not None:
-            extra.append(f"DifficultyFlavorKey={flavor_value}{add_eol}")
-        lines[insert_at:insert_at] = extra
-    return text[:s] + "".join(lines) + text[e:]
+        return block + (eol + text if text else "")
+    return text[:s] + _info_section_body(text, (s, e), display_name, tag_value, flavor_value, notes_text, eol) + text[e:]
 
 
-def _update_gameplay_tag_list(text: str, tag_value: str) -> str:
+def _update_gameplay_tag_list(text: str, tag_value: str, *, span: tuple[int, int] | None = None) -> str:
     """Replace the first GameplayTagList Tag that starts with "Difficulty." with tag_value.
     If none exists, append one at the end of the block or create the block if missing.
+    ``span`` is the section's precomputed (start, end), if already known.
     """
-    header = "[/Script/GameplayTags.GameplayTagsList]"
-    s, e = _find_section_exact(text, header)
-    eol = "\n" if ("\r\n" not in text) else "\r\n"
-    line_tpl = f"GameplayTagList=(Tag=\"{tag_value}\",DevComment=\"\"){eol}"
+    header = _GAMEPLAY_TAGS_HEADER
+    s, e = span if span is not None else _find_section_exact(text, header)
+    eol = _detect_eol(text)
     if s < 0:
-        block = header + eol + line_tpl
+        block = header + eol + f"GameplayTagList=(Tag=\"{tag_value}\",DevComment=\"\"){eol}"
         joiner = eol if text and not text.endswith(("\n", "\r")) else ""
         return text + joiner + block
-    block = text[s:e]
-    lines = block.splitlines(keepends=True)
-    replaced = False
-    for i, ln in enumerate(lines):
-        if ln.strip().startswith('GameplayTagList=') and 'Tag="Difficulty.' in ln:
-            # preserve EOL of this line
-            eol_i = "\n" if ln.endswith("\n") else ("\r\n" if ln.endswith("\r\n") else eol)
-            lines[i] = f"GameplayTagList=(Tag=\"{tag_value}\",DevComment=\"\"){eol_i}"
-            replaced = True
-            break
-    if not replaced:
-        # append one line
-        lines.append(line_tpl)
-    return text[:s] + "".join(lines) + text[e:]
+    start, end, replacement = _gameplay_tag_splice(text, (s, e), tag_value, eol)
+    return text[:start] + replacement + text[end:]
 
 
 def apply_modname_mappings(modname: str, version: str | None = None, date_str: str | None = None, notes_text: str | None = None) -> None:
@@ -1106,8 +1604,40 @@ def apply_modname_mappings(modname: str, version: str | None = None, date_str: s
     Always update readable fields (DifficultyNameKey, DifficultySubtextKey,
     DifficultyFlavorKey) from the current inputs.
     """
-    # Read existing mapping from mirror
     mirror = _read_mirror_dict()
+    _apply_modname_mappings_to(mirror, modname, version, date_str, notes_text)
+    _write_mirror_dict(mirror)
+
+
+# (work.ini stamp, mapping inputs) of the last applied mapping; lets repeated
+# identical updates skip the read + rewrite while the file is untouched
+_last_mapping_sig: tuple[tuple[str, int, int], tuple[str, str, str | None, str | None]] | None = None
+
+
+def _apply_mapping_fields_to_work(path: Path, display_name: str, tag_value: str, flavor_value: str | None, notes_text: str | None) -> None:
+    """Write the mapping fields into [Info] and GameplayTags unless already applied."""
+    global _last_mapping_sig
+    inputs = (display_name, tag_value, flavor_value, notes_text)
+    stamp = _mirror_stamp(path)
+    last = _last_mapping_sig
+    if stamp is not None and last is not None and last == (stamp, inputs):
+        return
+    text = _read_work_text(path)
+    updated = _update_mapping_sections(text, display_name, tag_value, flavor_value, notes_text)
+    if updated != text:
+        _write_text(path, updated)
+        _publish_work_ini_changed()
+        _publish_work_ini_reset()
+        stamp = _mirror_stamp(path)
+    _last_mapping_sig = (stamp, inputs) if stamp is not None else None
+
+
+def _apply_modname_mappings_to(mirror: dict[str, str], modname: str, version: str | None = None, date_str: str | None = None, notes_text: str | None = None) -> None:
+    """Apply the mappings to work.ini and merge the mirror fields into ``mirror``.
+
+    Body of ``apply_modname_mappings``; the caller owns reading and writing the
+    mirror so several mirror edits can share one read-modify-write.
+    """
     existing_tag = mirror.get("GameplayTag") or mirror.get("DifficultyGameplayTag")
 
     # Get last stored modname to detect changes
@@ -1132,13 +1662,13 @@ def apply_modname_mappings(modname: str, version: str | None = None, date_str: s
                 number = 1
         except Exception:
             # If parsing fails, generate new code
-            prefix, number = _generate_code_for_modname(modname)
+            prefix, number = _generate_code_for_modname(modname, mirror)
         difficulty = get_current_difficulty_from_work()
         root = _difficulty_tag_root(difficulty)
         tag_value = f"{root}{prefix}{number}"
     else:
         # First run (or after Clean/Uninstall): generate new random code
-        prefix, number = _generate_code_for_modname(modname)
+        prefix, number = _generate_code_for_modname(modname, mirror)
         difficulty = get_current_difficulty_from_work()
         root = _difficulty_tag_root(difficulty)
         tag_value = f"{root}{prefix}{number}"
@@ -1147,24 +1677,13 @@ def apply_modname_mappings(modname: str, version: str | None = None, date_str: s
     ver = (version or "").strip()
     display_name = modname.strip() if not ver else f"{modname.strip()} {ver}"
 
+    flush_pending_writes()
     path = _work_ini_path()
-    text = _read_text(path)
     flavor_value = _format_flavor_value(date_str) if (date_str is not None and str(date_str).strip()) else None
-    updated = _update_info_block_with_modname(text, display_name, tag_value, flavor_value, notes_text)
-    updated = _update_gameplay_tag_list(updated, tag_value)
-    if updated != text:
-        _write_text(path, updated)
-        _publish_work_ini_changed()
-        try:
-            if _event_bus is not None:
-                _event_bus.publish("work_ini_reset")
-        except Exception:
-            pass
+    _apply_mapping_fields_to_work(path, display_name, tag_value, flavor_value, notes_text)
     # Mirror: purge legacy keys and persist only new mapping fields
-    try:
-        _purge_legacy_keys_from_mirror()
-    except Exception:
-        pass
+    for k in _LEGACY_USER_KEYS:
+        mirror.pop(k, None)
     mm: dict[str, str] = {
         # Persist mapping (prefix/number) when known
         "DifficultyNameKey": display_name,
@@ -1180,7 +1699,7 @@ def apply_modname_mappings(modname: str, version: str | None = None, date_str: s
         mm["CodeNumber"] = str(number)
     if flavor_value is not None:
         mm["DifficultyFlavorKey"] = flavor_value
-    _write_mirror_merge(mm)
+    mirror.update(mm)
 
 # Public helper for GUI live-updates
 # Public helpers for GUI - these now work ONLY with the new mapping system
@@ -1231,6 +1750,29 @@ def get_user_info() -> dict[str, str]:
 # Single background writer to avoid UI stalls
 # ---------------------------------------------------------------------------
 
+def _split_user_info(values: dict[str, str] | None) -> tuple[str, str, str, str, dict[str, str]]:
+    """Return (modname, version, date, notes, ui_vals) from GUI user-info values.
+
+    Keys are matched case-insensitively in a single pass; ``ui_vals`` holds the
+    UI_* mirror entries (notes encoded, template never persisted).
+    """
+    mod = ver = dt = nt = ""
+    ui_vals: dict[str, str] = {}
+    for k, v in (values or {}).items():
+        kl = k.lower() if isinstance(k, str) else str(k).lower()
+        sv = v if isinstance(v, str) else str(v)
+        if kl == "modname":
+            mod = ui_vals["UI_Modname"] = sv
+        elif kl == "version":
+            ver = ui_vals["UI_Version"] = sv
+        elif kl == "date":
+            dt = ui_vals["UI_Date"] = sv
+        elif kl == "notes":
+            nt = sv
+            ui_vals["UI_Notes"] = _encode_multiline(sv)
+    return mod, ver, dt, nt, ui_vals
+
+
 class _WriteWorker:
     def __init__(self) -> None:
         self._thread: threading.Thread | None = None
@@ -1241,6 +1783,9 @@ class _WriteWorker:
         self._lock = threading.Lock()
         self._last_written: dict[str, str] = {}  # No longer tracks legacy keys
         self._debounce_ms = 0.3  # seconds
+        # Delayed LiveSync resume: one deadline for all pending requests
+        self._resume_deadline: float | None = None
+        self._resume_trigger = False
 
     def start(self) -> None:
         if self._thread and self._thread.is_alive():
@@ -1255,60 +1800,47 @@ class _WriteWorker:
         t = self._thread
         if t and t.is_alive():
             t.join(timeout=0.5)
+        _FILE_WRITER.sync()
+
+    def schedule_resume(self, delay: float, *, trigger_sync: bool) -> None:
+        """Resume LiveSync once ``delay`` seconds from now (latest request wins the deadline)."""
+        deadline = monotonic() + max(0.0, delay)
+        with self._lock:
+            if self._resume_deadline is None or deadline > self._resume_deadline:
+                self._resume_deadline = deadline
+            self._resume_trigger = self._resume_trigger or trigger_sync
+        self.start()
+        self._wake.set()
+
+    def _take_due_resume(self) -> bool | None:
+        """Return the trigger flag if the resume deadline has passed, else None."""
+        with self._lock:
+            if self._resume_deadline is None or monotonic() < self._resume_deadline:
+                return None
+            trigger = self._resume_trigger
+            self._resume_deadline = None
+            self._resume_trigger = False
+            return trigger
 
     def enqueue_user_info(self, values: dict[str, str], *, write_work: bool, write_mirror: bool) -> None:
+        if not values or not (write_work or write_mirror):
+            return
+        mod, ver, dt, nt, ui_vals = _split_user_info(values)
         # CRITICAL: Write UI_Modname to mirror FIRST before apply_modname_mappings reads it!
         # This ensures modname change detection works correctly.
-        try:
-            if write_mirror:
-                ui_vals: dict[str, str] = {}
-                # Normalize expected inputs and map to UI_* keys
-                for k, v in (values or {}).items():
-                    kl = str(k).lower()
-                    if kl == "modname":
-                        ui_vals["UI_Modname"] = str(v)
-                    elif kl == "version":
-                        ui_vals["UI_Version"] = str(v)
-                    elif kl == "date":
-                        ui_vals["UI_Date"] = str(v)
-                    elif kl == "notes":
-                        ui_vals["UI_Notes"] = _encode_multiline(str(v))
-                    # Do not persist template in mirror
-                if ui_vals:
-                    _write_mirror_merge(ui_vals)
-        except Exception:
-            pass
+        if write_mirror and ui_vals:
+            try:
+                _write_mirror_merge(ui_vals)
+            except Exception:
+                pass
 
         # Apply Modname mappings for work.ini when requested
         # This reads UI_Modname from mirror to detect changes
-        try:
-            if write_work:
-                mod = ""
-                ver = ""
-                dt = ""
-                nt = ""
-                for k, v in (values or {}).items():
-                    if str(k).lower() == "modname":
-                        mod = str(v)
-                        # do not break; also probe for version
-                        continue
-
-                for k, v in (values or {}).items():
-                    if str(k).lower() == "version":
-                        ver = str(v)
-                        break
-                for k, v in (values or {}).items():
-                    if str(k).lower() == "date":
-                        dt = str(v)
-                        break
-                for k, v in (values or {}).items():
-                    if str(k).lower() == "notes":
-                        nt = str(v)
-                        break
-                if mod:
-                    apply_modname_mappings(mod, ver, dt, nt)
-        except Exception:
-            pass
+        if write_work and mod:
+            try:
+                apply_modname_mappings(mod, ver, dt, nt)
+            except Exception:
+                pass
 
     def _coalesce_latest(self) -> tuple[dict[str, str], bool, bool] | None:
         with self._lock:
@@ -1329,51 +1861,48 @@ class _WriteWorker:
         pending: tuple[dict[str, str], bool, bool] | None = None
         next_flush = 0.0
         while not self._shutdown:
-            # Wait for new work or flush timeout
+            # Wait for new work, the flush timeout or the resume deadline
+            now = monotonic()
+            deadlines = [next_flush] if pending else []
+            resume_at = self._resume_deadline
+            if resume_at is not None:
+                deadlines.append(resume_at)
+            timeout = max(0.0, min(deadlines) - now) if deadlines else None
+            # Only an actual wake-up can bring new work; a timeout means a
+            # deadline is due and the queue need not be inspected
+            latest = None
+            if self._wake.wait(timeout):
+                self._wake.clear()
+                latest = self._coalesce_latest()
             now = monotonic()
-            timeout = max(0.0, next_flush - now) if pending else None
-            self._wake.wait(timeout)
-            self._wake.clear()
-
-            # Grab newest work
-            latest = self._coalesce_latest()
             if latest:
+                # New work re-arms the debounce, so nothing can be due yet
                 pending = latest
-                next_flush = monotonic() + self._debounce_ms
-
-            # Flush if due
-            if pending and monotonic() >= next_flush:
+                next_flush = now + self._debounce_ms
+            elif pending and now >= next_flush:
                 vals, write_work, write_mirror = pending
                 try:
+                    mod, ver, dt, nt, ui_vals = _split_user_info(vals)
                     # Write work.ini by applying mappings (no legacy keys written!)
-                    if write_work:
-                        mod = vals.get("Modname", "")
-                        ver = vals.get("Version", "")
-                        dt = vals.get("Date", "")
-                        nt = vals.get("Notes", "")
-                        if mod:
-                            apply_modname_mappings(mod, ver, dt, nt)
+                    if write_work and mod:
+                        apply_modname_mappings(mod, ver, dt, nt)
                     # Always write mirror when requested (debounced by caller)
-                    if write_mirror:
-                        ui_vals: dict[str, str] = {}
-                        for k, v in vals.items():
-                            kl = str(k).lower()
-                            if kl == "modname":
-                                ui_vals["UI_Modname"] = str(v)
-                            elif kl == "version":
-                                ui_vals["UI_Version"] = str(v)
-                            elif kl == "date":
-                                ui_vals["UI_Date"] = str(v)
-                            elif kl == "notes":
-                                ui_vals["UI_Notes"] = _encode_multiline(str(v))
-                        if ui_vals:
-                            _write_mirror_merge(ui_vals)
+                    if write_mirror and ui_vals:
+                        _write_mirror_merge(ui_vals)
                 except Exception:
                     # swallow to keep worker alive
                     pass
                 finally:
                     pending = None
 
+            # Delayed LiveSync resume
+            trigger = self._take_due_resume()
+            if trigger is not None:
+                try:
+                    resume_live_sync(trigger_sync=trigger)
+                except Exception:
+                    pass
+
 
 _WRITER = _WriteWorker()
 
@@ -1443,21 +1972,9 @@ def resume_live_sync_after(delay_seconds: float = 3.0, *, trigger_sync: bool = T
     except Exception:
         delay = 3.0
 
-    def _delayed():
-        try:
-            import time
-            time.sleep(max(0.0, delay))
-        except Exception:
-            pass
-        # After delay, resume as usual
-        try:
-            resume_live_sync(trigger_sync=trigger_sync)
-        except Exception:
-            pass
-
+    # Handled by the single writer thread; repeated calls share one deadline
     try:
-        t = threading.Thread(target=_delayed, daemon=True)
-        t.start()
+        _WRITER.schedule_resume(delay, trigger_sync=trigger_sync)
     except Exception:
         # Fallback to immediate resume if threading fails
         resume_live_sync(trigger_sync=trigger_sync)
@@ -1466,20 +1983,24 @@ def resume_live_sync_after(delay_seconds: float = 3.0, *, trigger_sync: bool = T
 # Template loading system
 # ---------------------------------------------------------------------------
 
-def _template_directories() -> list[Path]:
+@lru_cache(maxsize=1)
+def _template_directories() -> tuple[Path, ...]:
     """Return paths to template directories (user templates first, then standard templates)."""
-    from system.config_main.main_actions import get_user_mod_files_path, get_application_base_path
-    
     # 1. Benutzervorlagen im AppData-Verzeichnis
-    user_templates = get_user_mod_files_path() / "MyTemplates"
+    user_root = get_user_mod_files_path() if get_user_mod_files_path is not None else _user_mod_files_fallback()
+    user_templates = user_root / "MyTemplates"
     
     # 2. Standardvorlagen im Programmverzeichnis
-    app_root = get_application_base_path()
+    app_root = _app_base_path() if get_application_base_path is not None else _application_root()
     standard_templates = app_root / "system" / "templates" / "standard_templates"
-    return [
+    return (
         user_templates,
         standard_templates,
-    ]
+    )
+
+
+# (directory mtimes, sorted filenames) of the last template scan
+_TEMPLATES_CACHE: tuple[tuple[int, ...], tuple[str, ...]] | None = None
 
 
 def get_available_templates() -> list[str]:
@@ -1487,28 +2008,47 @@ def get_available_templates() -> list[str]:
     
     Returns actual filenames (e.g., "Strat_RealLife_357.ini") sorted alphabetically.
     
-    Always performs a fresh scan - no caching.
+    The listing is rescanned whenever a template directory's mtime changes
+    (files added, removed or renamed); otherwise the last scan is reused.
     """
+    global _TEMPLATES_CACHE
+    dirs = _template_directories()
+    key: list[int] = []
+    for directory in dirs:
+        try:
+            key.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            key.append(0)
+    cached = _TEMPLATES_CACHE
+    if cached is not None and cached[0] == tuple(key):
+        return list(cached[1])
+
     templates: set[str] = set()
-    for directory in _template_directories():
-        if not directory.exists():
+    for directory, mtime in zip(dirs, key):
+        if not mtime:
             continue
         try:
-            # Force fresh scan by using glob
+            # Directory changed since the last scan: list it again
             for file in directory.glob("*.ini"):
                 # Only include files, not directories
                 if file.is_file():
                     templates.add(file.name)
         except Exception:
             continue
-    
-    return sorted(templates)
+
+    result = sorted(templates)
+    _TEMPLATES_CACHE = (tuple(key), tuple(result))
+    return result
 
 
 # Removed get_template_filename_from_display() - no longer needed
 # GUI now uses tuples (display_name, filename) directly
 
 
+# DifficultyNameKey line (any case) inside a template's [Info] section
+_DIFFKEY_RX = re.compile(r"^[^\S\n]*DifficultyNameKey=(?P<val>[^\n]*)", re.IGNORECASE | re.MULTILINE)
+
+
 def _extract_modname_from_template(template_path: Path) -> str:
     """Extract display name from a template file.
     
@@ -1517,30 +2057,15 @@ def _extract_modname_from_template(template_path: Path) -> str:
     """
     try:
         content = template_path.read_text(encoding="utf-8", errors="ignore")
-        lines = content.splitlines()
-        
-        # Look for DifficultyNameKey in [Info] section
-        in_info_section = False
-        for line in lines:
-            stripped = line.strip()
-            
-            # Check for [Info] section start
-            if stripped == "[Info]":
-                in_info_section = True
-                continue
-            
-            # Exit [Info] section if we hit another section
-            if in_info_section and stripped.startswith("[") and stripped.endswith("]"):
-                in_info_section = False
-            
-            # Look for DifficultyNameKey in [Info] section
-            if in_info_section and stripped.lower().startswith("difficultynamekey="):
-                value = stripped.split("=", 1)[1].strip()
-                # Remove quotes if present
-                value = value.strip('"').strip()
-                if value:
-                    return value
-        
+        s, e = _find_section_exact(content, _INFO_HEADER)
+        if s < 0:
+            return ""
+        # Scan only the [Info] range; stop at the first non-empty value
+        for m in _DIFFKEY_RX.finditer(content, s, e):
+            # Remove quotes if present
+            value = m.group("val").strip().strip('"').strip()
+            if value:
+                return value
         return ""
     except Exception:
         return ""
@@ -1583,6 +2108,21 @@ def validate_template_format(template_path: Path) -> bool:
         return False
 
 
+# (template path, template digest, work.ini digest) right after the last
+# successful load_template. Content digests, not mtime/size stamps, so a
+# same-size edit within the filesystem's timestamp granularity is noticed
+_loaded_template_sig: tuple[str, bytes, bytes] | None = None
+
+
+def _template_load_sig(template_path: Path, work_path: Path) -> tuple[str, bytes, bytes]:
+    """Return the content fingerprint of a template and work.ini pair."""
+    return (
+        str(template_path),
+        hashlib.blake2b(_read_bytes(template_path), digest_size=16).digest(),
+        hashlib.blake2b(_read_bytes(work_path), digest_size=16).digest(),
+    )
+
+
 def load_template(template_name: str) -> tuple[bool, str]:
     """Load a template and replace current work.ini content.
     
@@ -1600,8 +2140,11 @@ def load_template(template_name: str) -> tuple[bool, str]:
     Returns:
         Tuple of (success: bool, message: str)
         - (True, "Template loaded successfully") on success
+        - (True, "Template already loaded") when neither the template nor
+          work.ini changed since this template was last loaded
         - (False, "error message") on failure
     """
+    global _loaded_template_sig
     try:
         # Pause Live Sync immediately
         pause_live_sync()
@@ -1617,6 +2160,14 @@ def load_template(template_name: str) -> tuple[bool, str]:
             resume_live_sync(trigger_sync=False)
             return (False, "Template is not in Live Mod format and must be converted first.")
         
+        # Re-selecting the loaded template is a no-op while work.ini is untouched
+        flush_pending_writes()
+        work_path = _work_ini_path()
+        if _loaded_template_sig is not None and _loaded_template_sig == _template_load_sig(template_path, work_path):
+            resume_live_sync(trigger_sync=False)
+            return (True, "Template already loaded")
+        _loaded_template_sig = None
+        
         # Backup user's Modname and Version from mirror file (if they exist)
         mirror_vals = _read_user_info_from_mirror()
         saved_modname = (mirror_vals.get("Modname") or "").strip()
@@ -1626,15 +2177,10 @@ def load_template(template_name: str) -> tuple[bool, str]:
         template_content = template_path.read_text(encoding="utf-8")
         
         # Write template to work.ini
-        work_path = _work_ini_path()
         work_path.parent.mkdir(parents=True, exist_ok=True)
         _write_text(work_path, template_content)
         # Publish reset event to trigger full UI rebuild (missions list reload)
-        try:
-            if _event_bus is not None:
-                _event_bus.publish("work_ini_reset")
-        except Exception:
-            pass
+        _publish_work_ini_reset()
         _publish_work_ini_changed()
         
         # Restore user's Modname and Version if they were saved
@@ -1649,16 +2195,11 @@ def load_template(template_name: str) -> tuple[bool, str]:
             write_ini_values(restore_values)
         # After loading a template, force a new code/tag automatically
         try:
-            _purge_mapping_keys_from_mirror()
-            ui = get_user_ui_info_from_mirror()
-            mod = ui.get("Modname", "") or restore_values.get("Modname", "")
-            ver = ui.get("Version", "") or restore_values.get("Version", "")
-            dt = ui.get("Date", "")
-            nt = ui.get("Notes", "")
-            if mod:
-                apply_modname_mappings(mod, ver, dt, nt)
+            _rebuild_mapping_atomically(fallback=restore_values)
         except Exception:
             pass
+        flush_pending_writes()
+        _loaded_template_sig = _template_load_sig(template_path, work_path)
         
         # Resume Live Sync and trigger immediate sync
         resume_live_sync(trigger_sync=True)
@@ -1678,6 +2219,19 @@ def load_template(template_name: str) -> tuple[bool, str]:
 # Remove all traps/bombs helpers
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=32)
+def _param_line_rx(key: str) -> re.Pattern[str]:
+    """Return the cached multiline pattern for every ``key = value`` line of ``key`` (any case).
+
+    Captures: (prefix)(key)(sep)(eol); the value itself is replaced.
+    """
+    return re.compile(
+        rf"^(?P<prefix>[^\S\r\n]*)(?P<key>{re.escape(key)})"
+        rf"(?P<sep>[^\S\r\n]*=[^\S\r\n]*)[^\r\n]*(?P<eol>\r\n|\n|\r|\Z)",
+        re.IGNORECASE | re.MULTILINE,
+    )
+
+
 def remove_all_parameter_values(parameter_key: str, new_value: str = "0") -> None:
     """Set all occurrences of a parameter to a specific value in the entire work.ini.
 
@@ -1688,54 +2242,32 @@ def remove_all_parameter_values(parameter_key: str, new_value: str = "0") -> Non
         parameter_key: The INI key to modify (e.g., "MaxTraps", "MaxBombs")
         new_value: The new value to set (default: "0")
     """
+    flush_pending_writes()
     work_path = _work_ini_path()
     if not work_path.exists():
         return
 
-    text = _read_text(work_path)
+    text = _read_work_text(work_path)
     if not text:
         return
 
     # Detect newline style
-    newline = "\r\n" if "\r\n" in text else "\n"
-    lines = text.splitlines(keepends=True)
-
-    # Build regex pattern to match the parameter line
-    # Captures: (prefix)(key)(sep)(value)(eol)
-    pattern = re.compile(
-        rf"^(?P<prefix>\s*)(?P<key>{re.escape(parameter_key)})"
-        rf"(?P<sep>\s*=\s*)(?P<val>.*?)(?P<eol>(\r\n|\n|\r)?)$",
-        re.IGNORECASE,
-    )
+    newline = _detect_eol(text)
 
-    # Replace all matching lines
-    modified = False
-    for i, line in enumerate(lines):
-        # Skip commented lines
-        if line.lstrip().startswith((';', '#')):
-            continue
+    # Replace all matching lines in one pass; commented lines never match
+    # because the key must follow the leading blanks directly
+    def _replace(m: re.Match[str]) -> str:
+        # Preserve formatting (prefix, separator, EOL)
+        return f"{m.group('prefix')}{m.group('key')}{m.group('sep')}{new_value}{m.group('eol') or newline}"
+
+    updated_text, count = _param_line_rx(parameter_key).subn(_replace, text)
 
-        m = pattern.match(line)
-        if m:
-            # Preserve formatting (prefix, separator, EOL)
-            prefix = m.group('prefix')
-            key = m.group('key')
-            separator = m.group('sep')
-            eol = m.group('eol') if m.group('eol') else newline
-            lines[i] = f"{prefix}{key}{separator}{new_value}{eol}"
-            modified = True
-
-    if modified:
-        updated_text = "".join(lines)
+    if count:
         _write_text(work_path, updated_text)
         # Publish BOTH events to ensure all tabs refresh
         _publish_work_ini_changed()
         # Also publish reset event to force full rebuild in all tabs
-        try:
-            if _event_bus is not None:
-                _event_bus.publish("work_ini_reset")
-        except Exception:
-            pass
+        _publish_work_ini_reset()
 
 
 def remove_all_traps_action() -> None:
@@ -1746,3 +2278,13 @@ def remove_all_traps_action() -> None:
 def remove_all_bombs_action() -> None:
     """Remove all bombs from all missions by setting MaxBombs=0 everywhere."""
     remove_all_parameter_values("MaxBombs", "0")
+
+
+# Imported last, like main_actions does with footer_actions: main_actions pulls
+# in footer_actions, which imports from this module, so every name above must
+# already exist when that cycle runs.
+try:
+    from system.config_main.main_actions import get_application_base_path, get_user_mod_files_path
+except Exception:  # pragma: no cover
+    get_application_base_path = None  # type: ignore
+    get_user_mod_files_path = None  # type: ignore
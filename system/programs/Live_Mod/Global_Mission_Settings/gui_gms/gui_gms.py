@@ -11,7 +11,7 @@ import os
 import tkinter as tk
 from tkinter import font as tkfont
 from tkinter import ttk
-from typing import Iterable
+from typing import Callable, Iterable
 from pathlib import Path
 import re
 try:
@@ -50,6 +50,7 @@ from ..config_gms.gms_actions import (
     enqueue_user_info,
     read_ini_values,
     write_ini_values,
+    flush_pending_writes,
     read_keys_with_comment_state,
     write_keys_with_comment_state,
     remove_all_traps_action,
@@ -93,6 +94,11 @@ else:
 class GlobalMissionSettingsApp:
     """Standalone Tk application that mirrors the legacy Global Mission Settings UI."""
 
+    # Font candidates -> the candidate that resolved (None: TkDefaultFont
+    # fallback). Shared by all instances so reopening the window skips probing;
+    # families are stored rather than Font objects, which belong to one Tk root.
+    _FONT_RESOLUTION_CACHE: dict[tuple[tuple[str, int, str], ...], tuple[str, int, str] | None] = {}
+
     def __init__(self, parent: tk.Widget | None = None, main_app=None) -> None:
         # Allow standalone creation without an external parent
         self.main_app = main_app
@@ -135,9 +141,14 @@ class GlobalMissionSettingsApp:
 
         # Start empty; will populate from work.ini [Global] if available
         self.all_entries = []
-        self.entry_index_map = {entry: idx for idx, entry in enumerate(self.all_entries)}
         self.filtered_entries: list[ParameterEntry] = list(self.all_entries)
-        self.category_positions = self._build_category_positions(self.all_entries)
+        self.entry_index_map: dict[ParameterEntry, int] = {}
+        self.category_positions: dict[str, int] = {}
+        # Entries per category and lower-cased search text per entry (by
+        # category, None = all); rebuilt whenever all_entries is replaced
+        self._entries_by_category: dict[str, list[ParameterEntry]] = {}
+        self._search_index: dict[str | None, list[tuple[str, ParameterEntry]]] = {}
+        self._rebuild_indices()
 
         self.search_var = tk.StringVar()
         self.metadata_vars = {
@@ -162,6 +173,10 @@ class GlobalMissionSettingsApp:
 
         self.row_entries: dict[str, dict[str, ParameterEntry | None]] = {}
         self.entry_positions_in_view: dict[int, tuple[str, str]] = {}
+        # Fixed pool of tree rows (one per visible row) reused across refreshes,
+        # with the values last written to each row
+        self._row_item_ids: list[str] = []
+        self._row_cache: dict[str, tuple[str, str, str, str]] = {}
         self.last_selected_item: str | None = None
         self.last_selected_side: str = "left"
 
@@ -180,6 +195,9 @@ class GlobalMissionSettingsApp:
         self._editing_in_progress = False
         # Flag to force full rebuild on next poll (for Clean All, templates, etc.)
         self._force_full_rebuild = False
+        # UI updates coalesced per key and run once on the next idle tick
+        self._pending_ui_updates: dict[str, Callable[[], None]] = {}
+        self._ui_flush_job: str | None = None
 
         self.root.winfo_toplevel().report_callback_exception = self._handle_callback_exception
         # Try to build entries dynamically from work.ini [Global]
@@ -188,12 +206,6 @@ class GlobalMissionSettingsApp:
         except Exception:
             pass
 
-        # Preload English help texts (if available)
-        try:
-            self._load_help_texts()
-        except Exception:
-            self.help_texts = {}
-
         self._build_layout()
         self.root.bind("<Destroy>", self._on_destroy)
         # Select default category on launch
@@ -205,18 +217,34 @@ class GlobalMissionSettingsApp:
         except Exception:
             pass
         self._refresh_parameter_view()
-        # Auto-select first visible parameter so help box is populated
+        # Auto-select first visible parameter
         try:
             self._auto_select_first_row()
         except Exception:
             pass
+        # Remaining start-up work runs once the window is on screen
+        self._live_sync = None
+        self._idle_init_done = False
+        self._idle_init_job: str | None = self.root.after_idle(self._idle_init)
+
+    def _idle_init(self) -> None:
+        """Finish start-up on the first idle tick, after the window was drawn.
+
+        Each step is guarded on its own so a failure does not stop the rest.
+        """
+        self._idle_init_job = None
+        # Preload English help texts (if available)
+        try:
+            self._load_help_texts()
+        except Exception:
+            self.help_texts = {}
         # Load parameter values from work.ini for the visible parameter entries
         try:
-            self._load_parameters_from_work_ini()
-            self._refresh_parameter_view()
+            if self._load_parameters_from_work_ini():
+                self._refresh_parameter_view()
         except Exception:
             pass
-        # Ensure a selection after loading values
+        # Ensure a selection after loading values (also shows its help text)
         try:
             self._auto_select_first_row()
         except Exception:
@@ -233,17 +261,30 @@ class GlobalMissionSettingsApp:
         try:
             from ..config_gms.gms_actions import get_user_ui_info_from_mirror
             initial = get_user_ui_info_from_mirror()
-            self.metadata_vars["mod_name"].set(initial.get("Modname") or "")
-            self.metadata_vars["version"].set(initial.get("Version") or "")
+            self._set_metadata("mod_name", initial.get("Modname") or "")
+            self._set_metadata("version", initial.get("Version") or "")
             # Always update Date to today's system date (ignore stored date)
-            self.metadata_vars["date"].set(current_date_string())
+            self._set_metadata("date", current_date_string())
             # Template: keep current value (don't override from mirror)
             # self.metadata_vars["template"].set(...) - intentionally not loaded from mirror
-            if self.notes_widget is not None:
-                self.notes_widget.delete("1.0", tk.END)
-                self.notes_widget.insert("1.0", initial.get("Notes") or "")
+            self._set_notes_text(initial.get("Notes") or "")
         except Exception:
             pass
+        self._idle_init_done = True
+
+    def _set_metadata(self, key: str, value: str) -> None:
+        """Set a metadata field, skipping the Tk variable write when it already holds ``value``."""
+        var = self.metadata_vars[key]
+        if var.get() != value:
+            var.set(value)
+
+    def _set_notes_text(self, text: str) -> None:
+        """Replace the Notes text unless it already matches."""
+        if self.notes_widget is None:
+            return
+        if self.notes_widget.get("1.0", "end-1c") != text:
+            self.notes_widget.delete("1.0", tk.END)
+            self.notes_widget.insert("1.0", text)
 
     def _auto_select_first_row(self) -> None:
         if not self.parameter_tree:
@@ -266,6 +307,13 @@ class GlobalMissionSettingsApp:
     def _on_destroy(self, _event: tk.Event | None = None) -> None:
         """Clean up resources when the widget is destroyed."""
         self._stop_marquee()
+        if getattr(self, "_ui_flush_job", None):
+            try:
+                self.root.after_cancel(self._ui_flush_job)
+            except Exception:
+                pass
+            self._ui_flush_job = None
+            self._pending_ui_updates.clear()
         # Stop file watcher
         if getattr(self, "_work_watch_job", None):
             try:
@@ -273,6 +321,22 @@ class GlobalMissionSettingsApp:
             except Exception:
                 pass
             self._work_watch_job = None  # type: ignore[attr-defined]
+        # Write parameter edits still waiting in the debounce window
+        try:
+            flush_pending_writes()
+        except Exception:
+            pass
+        # Closed before start-up finished: the fields were never loaded from
+        # the mirror, so writing them back would blank the stored user info
+        if not getattr(self, "_idle_init_done", False):
+            job = getattr(self, "_idle_init_job", None)
+            if job:
+                try:
+                    self.root.after_cancel(job)
+                except Exception:
+                    pass
+                self._idle_init_job = None
+            return
         # Final flush: write current user info to work.ini and mirror once
         try:
             notes_val = ""
@@ -365,13 +429,27 @@ class GlobalMissionSettingsApp:
         )
 
     def _create_font(self, *candidates: tuple[str, int, str]) -> tkfont.Font:
+        cache = GlobalMissionSettingsApp._FONT_RESOLUTION_CACHE
+        if candidates in cache:
+            resolved = cache[candidates]
+            if resolved is not None:
+                family, size, weight = resolved
+                try:
+                    return tkfont.Font(family=family, size=size, weight=weight)
+                except tk.TclError:
+                    pass
+            else:
+                candidates = ()
         for family, size, weight in candidates:
             try:
                 font = tkfont.Font(family=family, size=size, weight=weight)
                 if family.lower() in font.actual("family").lower():
+                    cache[candidates] = (family, size, weight)
                     return font
             except tk.TclError:
                 continue
+        if candidates:
+            cache[candidates] = None
         base = tkfont.nametofont("TkDefaultFont")
         base.configure(size=11, weight="bold")
         return base
@@ -428,73 +506,46 @@ class GlobalMissionSettingsApp:
             "button_gray": "#374151",    # darker gray
         }
         
-        for color_name, style_name in (
-            ("button_green", "GMS.Green.TButton"),
-            ("button_blue", "GMS.Blue.TButton"),
-            ("button_red", "GMS.Red.TButton"),
-            ("button_orange", "GMS.Orange.TButton"),
-            ("button_purple", "GMS.Purple.TButton"),
-            ("button_gray", "GMS.Gray.TButton"),
-        ):
-            self.style.configure(
-                style_name,
-                background=self.palette[color_name],
-                foreground=self.palette["button_text"],
-                borderwidth=0,
-                focusthickness=0,
-                relief=tk.FLAT,
-                font=self.fonts["button"],
-                anchor="center",
+        # Colored button styles: (style, background, font, pressed shade, hover shade)
+        p = self.palette
+        button_specs = [
+            (style_name, p[color_name], self.fonts["button"], pressed_shades[color_name], p[color_name])
+            for color_name, style_name in (
+                ("button_green", "GMS.Green.TButton"),
+                ("button_blue", "GMS.Blue.TButton"),
+                ("button_orange", "GMS.Orange.TButton"),
+                ("button_purple", "GMS.Purple.TButton"),
+                ("button_gray", "GMS.Gray.TButton"),
             )
-            self.style.map(
-                style_name,
-                background=[
-                    ("pressed", pressed_shades[color_name]),
-                    ("active", self.palette[color_name])
-                ],
-                foreground=[("disabled", "#6b7280")],
-            )
-        
-        # Special DarkRed style matching footer Uninstall button (#7f1d1d)
-        self.style.configure(
-            "GMS.DarkRed.TButton",
-            background="#7f1d1d",
-            foreground=self.palette["button_text"],
-            borderwidth=0,
-            focusthickness=0,
-            relief=tk.FLAT,
-            font=self.fonts["button"],
-            anchor="center",
-        )
-        self.style.map(
-            "GMS.DarkRed.TButton",
-            background=[
-                ("pressed", "#5f1515"),  # even darker on press
-                ("active", "#7f1d1d")
-            ],
-            foreground=[("disabled", "#6b7280")],
-        )
-
+        ]
+        # Red keeps a slightly lighter hover shade for visual richness
+        button_specs.append(("GMS.Red.TButton", p["button_red"], self.fonts["button"], pressed_shades["button_red"], "#991b1b"))
+        # Special DarkRed style matching footer Uninstall button (#7f1d1d), even darker on press
+        button_specs.append(("GMS.DarkRed.TButton", "#7f1d1d", self.fonts["button"], "#5f1515", "#7f1d1d"))
         # Dedicated condensed styles (same colors, narrower font) for category button override
         for color_name, style_name in (
             ("button_orange", "GMS.OrangeCondensed.TButton"),
             ("button_gray", "GMS.GrayCondensed.TButton"),
         ):
+            button_specs.append((style_name, p[color_name], self.fonts["button_condensed"], pressed_shades[color_name], p[color_name]))
+
+        # One configure + one map per style
+        for style_name, background, font, pressed, active in button_specs:
             self.style.configure(
                 style_name,
-                background=self.palette[color_name],
-                foreground=self.palette["button_text"],
+                background=background,
+                foreground=p["button_text"],
                 borderwidth=0,
                 focusthickness=0,
                 relief=tk.FLAT,
-                font=self.fonts["button_condensed"],
+                font=font,
                 anchor="center",
             )
             self.style.map(
                 style_name,
                 background=[
-                    ("pressed", pressed_shades[color_name]),
-                    ("active", self.palette[color_name])
+                    ("pressed", pressed),
+                    ("active", active)
                 ],
                 foreground=[("disabled", "#6b7280")],
             )
@@ -525,17 +576,6 @@ class GlobalMissionSettingsApp:
             ],
         )
 
-        # Note: Red button pressed shade already defined in main loop above
-        # Additional hover shade for visual richness
-        self.style.map(
-            "GMS.Red.TButton",
-            background=[
-                ("pressed", pressed_shades["button_red"]),
-                ("active", "#991b1b"),  # slightly lighter hover shade
-            ],
-            foreground=[("disabled", "#6b7280")],
-        )
-
         entry_style = {
             "fieldbackground": self.palette["entry_bg"],
             "foreground": self.palette["entry_fg"],
@@ -636,7 +676,8 @@ class GlobalMissionSettingsApp:
         self._build_right_panel(right_panel)
         # Start background watcher to refresh fields when work.ini changes externally
         self._work_watch_job: str | None = None
-        self._last_work_mtime: float | None = None
+        # (st_mtime_ns, st_size) of the work.ini state last seen by the watcher
+        self._last_work_stamp: tuple[int, int] | None = None
         try:
             self._schedule_work_watch()
         except Exception:
@@ -749,17 +790,13 @@ class GlobalMissionSettingsApp:
             font=self.fonts["entry_large"],
         )
         self.template_box.grid(row=9, column=0, sticky="ew", pady=(2, 8))
+        # Values last handed to the dropdown (to skip identical reconfigures)
+        self._template_values: tuple[str, ...] = ("Select a template...",)
         
         # Refresh template list when dropdown is opened
         def _on_dropdown_open(evt):
-            try:
-                # Force immediate refresh of templates
-                from ..config_gms.gms_actions import get_available_templates
-                templates = get_available_templates()  # Returns list of filenames
-                available_templates = ["Select a template..."] + templates
-                self.template_box.configure(values=available_templates)
-            except Exception:
-                pass
+            # Cheap when nothing changed: the listing is cached on directory mtimes
+            self._refresh_template_dropdown()
         
         # Bind to button press to refresh before opening
         self.template_box.bind('<Button-1>', _on_dropdown_open)
@@ -1112,8 +1149,7 @@ class GlobalMissionSettingsApp:
                     # Clear all cached data completely
                     self.all_entries = []
                     self.filtered_entries = []
-                    self.entry_index_map = {}
-                    self.category_positions = {}
+                    self._rebuild_indices()
                     # Rebuild entries from work.ini to get fresh values
                     self._try_build_entries_from_work_global()
                     # Reset to first page and clear category filter
@@ -1151,8 +1187,7 @@ class GlobalMissionSettingsApp:
                     # Clear all cached data completely
                     self.all_entries = []
                     self.filtered_entries = []
-                    self.entry_index_map = {}
-                    self.category_positions = {}
+                    self._rebuild_indices()
                     # Rebuild entries from work.ini to get fresh values
                     self._try_build_entries_from_work_global()
                     # Reset to first page and clear category filter
@@ -1204,30 +1239,31 @@ class GlobalMissionSettingsApp:
             positions.setdefault(entry.category, index)
         return positions
 
+    def _rebuild_indices(self) -> None:
+        """Rebuild every lookup derived from ``all_entries``; call after replacing it."""
+        self.entry_index_map = {entry: idx for idx, entry in enumerate(self.all_entries)}
+        self.category_positions = self._build_category_positions(self.all_entries)
+        by_category: dict[str, list[ParameterEntry]] = {}
+        search: dict[str | None, list[tuple[str, ParameterEntry]]] = {None: []}
+        for entry in self.all_entries:
+            by_category.setdefault(entry.category, []).append(entry)
+            # Search in display label (e.g., "Max Traps"), INI key (e.g., "MaxTraps")
+            # and label without spaces; NUL keeps a match from spanning two parts
+            label = entry.label.lower()
+            text = "\0".join((label, (getattr(entry, 'ini_key', None) or "").lower(), label.replace(" ", "")))
+            search[None].append((text, entry))
+            search.setdefault(entry.category, []).append((text, entry))
+        self._entries_by_category = by_category
+        self._search_index = search
+
     def _get_filtered_entries(self) -> list[ParameterEntry]:
         query = self.search_var.get().strip().lower()
-        entries = self.all_entries
-        if self.active_category:
-            entries = [e for e in entries if e.category == self.active_category]
+        category = self.active_category or None
         if not query:
-            return list(entries)
-        # Search in both display label (with spaces) and INI key (without spaces)
-        results = []
-        for entry in entries:
-            # Check display label (e.g., "Max Traps")
-            if query in entry.label.lower():
-                results.append(entry)
-                continue
-            # Check INI key (e.g., "MaxTraps")
-            ini_key = getattr(entry, 'ini_key', None)
-            if ini_key and query in ini_key.lower():
-                results.append(entry)
-                continue
-            # Fallback: check label without spaces (e.g., "MaxTraps" matches "Max Traps")
-            label_no_spaces = entry.label.replace(" ", "").lower()
-            if query in label_no_spaces:
-                results.append(entry)
-        return results
+            if category is None:
+                return list(self.all_entries)
+            return list(self._entries_by_category.get(category, ()))
+        return [entry for text, entry in self._search_index.get(category, ()) if query in text]
 
     # ------------------------------------------------------------------
     # Event handlers
@@ -1272,10 +1308,11 @@ class GlobalMissionSettingsApp:
         try:
             from ..config_gms.gms_actions import get_available_templates
             templates = get_available_templates()  # Returns list of filenames
-            available_templates = ["Select a template..."] + templates
-            # Update the dropdown values
-            if hasattr(self, 'template_box'):
+            available_templates = ("Select a template...", *templates)
+            # Update the dropdown values only when the list changed
+            if hasattr(self, 'template_box') and available_templates != self._template_values:
                 self.template_box.configure(values=available_templates)
+                self._template_values = available_templates
         except Exception:
             pass
 
@@ -1459,11 +1496,30 @@ class GlobalMissionSettingsApp:
 
     
 
+    def _schedule_ui_update(self, key: str, update: Callable[[], None]) -> None:
+        """Run ``update`` on the next idle tick; a newer update for ``key`` replaces it.
+
+        Bursts (typing in the search box, repeated paging) then redraw once
+        instead of once per event.
+        """
+        self._pending_ui_updates[key] = update
+        if self._ui_flush_job is None:
+            self._ui_flush_job = self.root.after_idle(self._flush_ui_updates)
+
+    def _flush_ui_updates(self) -> None:
+        self._ui_flush_job = None
+        pending, self._pending_ui_updates = self._pending_ui_updates, {}
+        for update in pending.values():
+            try:
+                update()
+            except Exception:
+                pass
+
     def _on_search_changed(self, *_: object) -> None:
         self.page_index = 0
         self.pending_entry_index = None
         self._set_active_category(None)
-        self._refresh_parameter_view()
+        self._schedule_ui_update("tree", self._refresh_parameter_view)
 
     def _change_page(self, delta: int) -> None:
         entries_count = len(self.filtered_entries)
@@ -1475,11 +1531,20 @@ class GlobalMissionSettingsApp:
             index = self.category_positions.get(self.active_category)
             if index is not None:
                 self.pending_entry_index = index
-        self._refresh_parameter_view()
+        self._schedule_ui_update("tree", self._refresh_parameter_view)
 
     # ------------------------------------------------------------------
     # Table helpers
     # ------------------------------------------------------------------
+    def _set_tree_cell(self, item_id: str, column: str, value: str) -> None:
+        """Write a single value cell outside of a refresh.
+
+        The row's cached values no longer match what is shown, so it is
+        dropped and the next refresh rewrites the row unconditionally.
+        """
+        self.parameter_tree.set(item_id, column, value)
+        self._row_cache.pop(item_id, None)
+
     def _update_tree_values_only(self) -> None:
         """Update only the values in the existing tree view without rebuilding.
         
@@ -1488,25 +1553,33 @@ class GlobalMissionSettingsApp:
         if not self.parameter_tree:
             return
         
-        # Update values in the tree based on current entry values
-        for item_id in self.parameter_tree.get_children(""):
-            row = self.row_entries.get(item_id, {})
+        # Update values in the tree based on current entry values; cells whose
+        # cached value already matches are left alone
+        for item_id, row in self.row_entries.items():
             left_entry = row.get("left")
             right_entry = row.get("right")
+            cached = self._row_cache.get(item_id)
             
             # Update left column value if entry exists
-            if left_entry:
+            if left_entry and (cached is None or cached[1] != left_entry.value):
                 try:
                     self.parameter_tree.set(item_id, "value_left", left_entry.value)
                 except Exception:
                     pass
             
             # Update right column value if entry exists
-            if right_entry:
+            if right_entry and (cached is None or cached[3] != right_entry.value):
                 try:
                     self.parameter_tree.set(item_id, "value_right", right_entry.value)
                 except Exception:
                     pass
+            if cached is not None:
+                self._row_cache[item_id] = (
+                    cached[0],
+                    left_entry.value if left_entry else cached[1],
+                    cached[2],
+                    right_entry.value if right_entry else cached[3],
+                )
 
     def _refresh_parameter_view(self) -> None:
         # Skip refresh if currently editing to avoid breaking navigation
@@ -1517,7 +1590,19 @@ class GlobalMissionSettingsApp:
             return
 
         self._stop_marquee()
-        self.parameter_tree.delete(*self.parameter_tree.get_children())
+        tree = self.parameter_tree
+        if len(self._row_item_ids) != self.rows_per_page:
+            # Build the row pool once; later refreshes only update values in place
+            tree.delete(*tree.get_children())
+            self._row_item_ids = [
+                tree.insert("", tk.END, iid=f"row{i}", values=("", "", "", ""), tags=("odd" if i % 2 else "even",))
+                for i in range(self.rows_per_page)
+            ]
+            self._row_cache = dict.fromkeys(self._row_item_ids, ("", "", "", ""))
+        else:
+            # Same as after the old delete(): no row stays selected across a refresh
+            tree.selection_remove(*tree.selection())
+            tree.focus("")
         self.row_entries = {}
         self.entry_positions_in_view = {}
         self.original_labels = {}
@@ -1556,12 +1641,10 @@ class GlobalMissionSettingsApp:
                     right_entry.value if right_entry else "",
                 )
 
-            item_id = self.parameter_tree.insert(
-                "",
-                tk.END,
-                values=values,
-                tags=("odd" if row_idx % 2 else "even",),
-            )
+            item_id = self._row_item_ids[row_idx]
+            if self._row_cache.get(item_id) != values:
+                tree.item(item_id, values=values)
+                self._row_cache[item_id] = values
 
             self.row_entries[item_id] = {"left": left_entry, "right": right_entry} 
             
@@ -1859,7 +1942,9 @@ class GlobalMissionSettingsApp:
             keys.append(ini_key if ini_key else self._label_to_ini_key(e.label))
         return keys
 
-    def _load_parameters_from_work_ini(self) -> None:
+    def _load_parameters_from_work_ini(self) -> bool:
+        """Copy [Global] values from work.ini into the entries; True if any value changed."""
+        changed = False
         entries = list(self.all_entries)
         keys = self._collect_ini_keys_for_entries(entries)
         values = {}
@@ -1870,11 +1955,13 @@ class GlobalMissionSettingsApp:
         for entry in entries:
             # Use the same key resolution as when writing: prefer explicit ini_key
             k = getattr(entry, 'ini_key', None) or self._label_to_ini_key(entry.label)
-            if k in values and values[k] != "":
+            if k in values and values[k] != "" and values[k] != entry.value:
                 try:
                     entry.value = values[k]  # type: ignore[attr-defined]
+                    changed = True
                 except Exception:
                     pass
+        return changed
 
     def _try_build_entries_from_work_global(self) -> None:
         """Replace demo entries with real [Global] keys from work.ini, preserving category headers.
@@ -1962,8 +2049,7 @@ class GlobalMissionSettingsApp:
         if entries:
             self.all_entries = entries
             self.filtered_entries = list(entries)
-            self.entry_index_map = {entry: idx for idx, entry in enumerate(self.all_entries)}
-            self.category_positions = self._build_category_positions(self.all_entries)
+            self._rebuild_indices()
 
     def _persist_user_info(self, *, immediate: bool = False) -> None:
         """Collect user info fields and persist them.
@@ -2020,16 +2106,17 @@ class GlobalMissionSettingsApp:
     def _poll_work_ini(self) -> None:
         try:
             path = _resolve_work_ini_path()
-            if not path.exists():
-                self._last_work_mtime = None
-                self._schedule_work_watch()
+            try:
+                stat = path.stat()
+            except OSError:
+                # Missing file; the finally block schedules the next poll
+                self._last_work_stamp = None
                 return
-            stat = path.stat()
-            mtime = stat.st_mtime
-            if self._last_work_mtime is None or mtime > self._last_work_mtime:
-                # CRITICAL: Update mtime BEFORE any processing to prevent infinite reload loops
-                # If we return early during editing, we still need to mark this mtime as "seen"
-                self._last_work_mtime = mtime
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            if stamp != self._last_work_stamp:
+                # CRITICAL: Update stamp BEFORE any processing to prevent infinite reload loops
+                # If we return early during editing, we still need to mark this stamp as "seen"
+                self._last_work_stamp = stamp
 
                 # Skip refresh entirely if currently editing (but mtime was already updated above)
                 if self._editing_in_progress:
@@ -2056,12 +2143,10 @@ class GlobalMissionSettingsApp:
                         try:
                             from ..config_gms.gms_actions import mirror_exists
                             if not mirror_exists():
-                                self.metadata_vars["mod_name"].set("")
-                                self.metadata_vars["version"].set("")
-                                self.metadata_vars["template"].set(self.metadata_vars["template"].get())
-                                self.metadata_vars["date"].set(current_date_string())
-                                if self.notes_widget is not None:
-                                    self.notes_widget.delete("1.0", tk.END)
+                                self._set_metadata("mod_name", "")
+                                self._set_metadata("version", "")
+                                self._set_metadata("date", current_date_string())
+                                self._set_notes_text("")
                         except Exception:
                             pass
                         # Reset the flag
@@ -2069,16 +2154,19 @@ class GlobalMissionSettingsApp:
                         return
 
                     # Small change: only reload VALUES without rebuilding structure
+                    changed = True
                     try:
-                        self._load_parameters_from_work_ini()
+                        changed = self._load_parameters_from_work_ini()
                     except Exception:
                         pass
 
-                    # Update only the visible values in the tree without rebuilding
-                    try:
-                        self._update_tree_values_only()
-                    except Exception:
-                        pass
+                    # Update only the visible values in the tree without rebuilding;
+                    # nothing to do when no parameter value actually changed
+                    if changed:
+                        try:
+                            self._update_tree_values_only()
+                        except Exception:
+                            pass
                 except Exception:
                     pass
         except Exception:
@@ -2148,7 +2236,7 @@ class GlobalMissionSettingsApp:
         # Update the tree
         try:
             if self.parameter_tree and self.parameter_tree.exists(item_id):
-                self.parameter_tree.set(item_id, column, new_val)
+                self._set_tree_cell(item_id, column, new_val)
         except Exception:
             pass
         
@@ -2164,7 +2252,7 @@ class GlobalMissionSettingsApp:
             try:
                 ini_key = getattr(model, 'ini_key', None) or self._label_to_ini_key(getattr(model, 'label', ''))
                 if ini_key:
-                    write_ini_values({ini_key: new_val})
+                    write_ini_values({ini_key: new_val}, root=self.root)
             except Exception:
                 pass
         
@@ -2368,7 +2456,7 @@ class GlobalMissionSettingsApp:
             new_val = entry.get()
             try:
                 if self.parameter_tree and self.parameter_tree.exists(item_id):
-                    self.parameter_tree.set(item_id, column, new_val)
+                    self._set_tree_cell(item_id, column, new_val)
             except Exception:
                 # Row may have been refreshed; ignore
                 pass
@@ -2383,7 +2471,7 @@ class GlobalMissionSettingsApp:
                 try:
                     ini_key = getattr(model, 'ini_key', None) or self._label_to_ini_key(getattr(model, 'label', ''))
                     if ini_key:
-                        write_ini_values({ini_key: new_val})
+                        write_ini_values({ini_key: new_val}, root=self.root)
                         # Don't reload immediately - let the editing flag protect the value
                         # The file watcher will update when editing_in_progress becomes False
                 except Exception:
@@ -2484,7 +2572,7 @@ class GlobalMissionSettingsApp:
             values = [name for name, v in vars_map.items() if v.get()]
             val = ", ".join(values)
             column = "value_left" if side == "left" else "value_right"
-            self.parameter_tree.set(item_id, column, val)
+            self._set_tree_cell(item_id, column, val)
             row = self.row_entries.get(item_id, {})
             model = row.get(side)
             if model:
@@ -2496,7 +2584,7 @@ class GlobalMissionSettingsApp:
                     # persist to work.ini
                     key = getattr(model, 'ini_key', None) or self._label_to_ini_key(getattr(model, 'label', ''))
                     if key:
-                        write_ini_values({key: val})
+                        write_ini_values({key: val}, root=self.root)
                 except Exception:
                     pass
             try:
@@ -2543,7 +2631,7 @@ class GlobalMissionSettingsApp:
         frame.pack(fill=tk.BOTH, expand=True)
         def choose(val: str) -> None:
             column = "value_left" if side == "left" else "value_right"
-            self.parameter_tree.set(item_id, column, val)
+            self._set_tree_cell(item_id, column, val)
             row = self.row_entries.get(item_id, {})
             model = row.get(side)
             if model:
@@ -2554,7 +2642,7 @@ class GlobalMissionSettingsApp:
                 try:
                     key = (getattr(model, 'ini_key', None) or key_guess or self._label_to_ini_key(getattr(model, 'label', '')))
                     if key:
-                        write_ini_values({key: val})
+                        write_ini_values({key: val}, root=self.root)
                         # Don't reload immediately - let the editing flag protect the value
                         # The file watcher will update when editing_in_progress becomes False
                 except Exception:
@@ -2633,7 +2721,7 @@ class GlobalMissionSettingsApp:
             values = [k for k, v in vars_map.items() if v.get()]
             val = ", ".join(values)
             column = "value_left" if side == "left" else "value_right"
-            self.parameter_tree.set(item_id, column, val)
+            self._set_tree_cell(item_id, column, val)
             row = self.row_entries.get(item_id, {})
             model = row.get(side)
             if model:
@@ -2644,7 +2732,7 @@ class GlobalMissionSettingsApp:
                 try:
                     key = getattr(model, 'ini_key', None) or self._label_to_ini_key(getattr(model, 'label', ''))
                     if key:
-                        write_ini_values({key: val})
+                        write_ini_values({key: val}, root=self.root)
                         # Don't reload immediately - let the editing flag protect the value
                         # The file watcher will update when editing_in_progress becomes False
                 except Exception: pass
@@ -2719,15 +2807,8 @@ class GlobalMissionSettingsApp:
         if not self.parameter_tree.winfo_exists():
             self.marquee_job = None
             return
+        # A vanished row makes set() raise, which drops its marquee below
         for (item_id, side), data in list(self.marquee_data.items()):
-            # Ensure item still exists; drop if not
-            try:
-                if (not self.parameter_tree) or (not self.parameter_tree.exists(item_id)):
-                    self.marquee_data.pop((item_id, side), None)
-                    continue
-            except Exception:
-                self.marquee_data.pop((item_id, side), None)
-                continue
             text = str(data.get("text", ""))
             index = int(data.get("index", 0))
             window = int(data.get("window", self.marquee_window))
@@ -2737,41 +2818,43 @@ class GlobalMissionSettingsApp:
             cycles_left = int(data.get("cycles_left", 1))
             column = "param_left" if side == "left" else "param_right"
             if len(text) <= window:
-                self.parameter_tree.set(item_id, column, text)
+                # Fits: show it once and stop animating this cell
+                try:
+                    self.parameter_tree.set(item_id, column, text)
+                except Exception:
+                    pass
+                self.marquee_data.pop((item_id, side), None)
                 continue
             if nowrap:
                 # Non-wrapping: slide left until the last fully-visible window, then pause, then restore
                 end_index = max(0, len(text) - window)
                 
-                # Check if we're at the end and pausing
-                if index >= end_index and pause_counter < self.marquee_pause_ms:
-                    # Show final position and increment pause counter
-                    slice_text = text[-window:] if window > 0 else text
-                    try:
-                        self.parameter_tree.set(item_id, column, slice_text)
-                    except Exception:
-                        self.marquee_data.pop((item_id, side), None)
-                        continue
-                    data["pause_counter"] = pause_counter + self.marquee_delay_ms
-                elif index >= end_index and pause_counter >= self.marquee_pause_ms:
+                if index >= end_index and pause_counter >= self.marquee_pause_ms:
                     # Pause complete: restore to beginning
                     try:
-                        if self.parameter_tree and self.parameter_tree.exists(item_id):
-                            self.parameter_tree.set(item_id, column, text[:window])
+                        self.parameter_tree.set(item_id, column, text[:window])
                     except Exception:
                         pass
                     self.marquee_data.pop((item_id, side), None)
                     continue
+                if index >= end_index:
+                    # Show final position and increment pause counter
+                    slice_text = text[-window:] if window > 0 else text
+                    data["pause_counter"] = pause_counter + self.marquee_delay_ms
                 else:
                     # Normal scrolling
                     slice_text = text[index : index + window]
+                    data["index"] = index + 1
+                    data["pause_counter"] = 0
+                # The cell is only rewritten when its text changes, so the
+                # pause at the end costs no Tk calls
+                if slice_text != data.get("shown"):
                     try:
                         self.parameter_tree.set(item_id, column, slice_text)
                     except Exception:
                         self.marquee_data.pop((item_id, side), None)
                         continue
-                    data["index"] = index + 1
-                    data["pause_counter"] = 0
+                    data["shown"] = slice_text
             else:
                 # Legacy wrapping mode (not used by default now)
                 extended = text + self.marquee_spacing + text
@@ -2828,6 +2911,8 @@ class GlobalMissionSettingsApp:
             "cycles_left": 1,
             "nowrap": True,
             "pause_counter": 0,
+            # text currently displayed in the cell
+            "shown": text[:window_chars],
         }
         try:
             if self.parameter_tree and self.parameter_tree.exists(item_id):